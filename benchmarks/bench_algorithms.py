@@ -0,0 +1,214 @@
+"""Scaling benchmarks for the valence-driven algorithms
+
+Sweeps problem size per algorithm with fixed seeds and records wall time,
+peak Python/NumPy memory (tracemalloc) and operations/sec. Results are
+stored as JSON so runs from different commits can be compared:
+
+    python benchmarks/bench_algorithms.py --quick -o before.json
+    python benchmarks/bench_algorithms.py --quick -o after.json --compare before.json --threshold 0.25
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+MEMBERS = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
+PROPOSAL = {'description': 'Benchmark proposal'}
+
+
+# Each case: (size, seed) → (callable, ops per call). Construction stays out of the timed region. Algorithms draw
+# their instances from default_rng(shard_seed), which seed_everything does not reach, so the seed is passed through.
+
+def case_qaoa(num_qubits, seed):
+    from valence_driven_qaoa import ValenceDrivenQAOA
+    qaoa = ValenceDrivenQAOA(MEMBERS, num_qubits=num_qubits, layers=2, shard_seed=seed)
+    params = np.linspace(0.1, 1.2, 2 * qaoa.layers)
+    evals = 20
+    return lambda: [qaoa.valence_expectation(params, PROPOSAL) for _ in range(evals)], evals
+
+
+def case_grover(search_space_size, seed):
+    from valence_driven_grover import ValenceDrivenGrover
+    grover = ValenceDrivenGrover(MEMBERS, search_space_size=search_space_size, shard_seed=seed)
+    return lambda: grover.grover_amplification(PROPOSAL), grover.optimal_iterations
+
+
+def case_qft(num_qubits, seed):
+    from valence_driven_qft import ValenceDrivenQFT
+    qft = ValenceDrivenQFT(MEMBERS, num_qubits=num_qubits, shard_seed=seed)
+    return lambda: qft.apply_qft(PROPOSAL), 1
+
+
+def case_qpe(counting_qubits, seed):
+    from valence_driven_qpe import ValenceDrivenQPE
+    qpe = ValenceDrivenQPE(MEMBERS, counting_qubits=counting_qubits, shard_seed=seed)
+    return lambda: qpe.estimate_phase(PROPOSAL), 1
+
+
+def case_adiabatic(num_qubits, seed):
+    from valence_driven_adiabatic import ValenceDrivenAdiabatic
+    adiabatic = ValenceDrivenAdiabatic(MEMBERS, num_qubits=num_qubits, total_time=20.0, shard_seed=seed)
+    return lambda: adiabatic.evolve_adiabatically(PROPOSAL), 1
+
+
+def case_annealing(problem_size, seed):
+    from valence_driven_annealing import ValenceDrivenAnnealing
+    annealing = ValenceDrivenAnnealing(MEMBERS, problem_size=problem_size, shard_seed=seed)
+    return lambda: annealing.anneal_for_thriving(PROPOSAL), 1
+
+
+def case_surface(distance, seed):
+    from valence_driven_surface_demo import ValenceSurfaceCodeDemo
+    demo = ValenceSurfaceCodeDemo(distance=distance)
+    return demo.run_demo, 1
+
+
+def case_surface_large(distance, seed):
+    from valence_driven_surface_large import ValenceLargeSurfaceCodeDemo
+    demo = ValenceLargeSurfaceCodeDemo(distance=distance)
+    cycles = 10
+    return lambda: demo.run_large_demo(cycles=cycles), cycles
+
+
+# name → (case, size parameter, full sweep, quick sweep)
+SUITE = {
+    'qaoa': (case_qaoa, 'num_qubits', [3, 4, 5, 6, 7, 8, 10, 12], [3, 5, 7]),
+    'grover': (case_grover, 'search_space_size', [4, 8, 16, 32, 64, 128], [4, 16, 64]),
+    'qft': (case_qft, 'num_qubits', [3, 4, 5, 6, 7, 8], [3, 5, 7]),
+    'qpe': (case_qpe, 'counting_qubits', [2, 3, 4, 5, 6], [2, 4]),
+    'adiabatic': (case_adiabatic, 'num_qubits', [2, 3, 4, 5, 6], [2, 3, 4]),
+    'annealing': (case_annealing, 'problem_size', [5, 10, 20, 40], [5, 10]),
+    'surface': (case_surface, 'distance', [3, 5, 7, 9, 11], [3, 7]),
+    'surface_large': (case_surface_large, 'distance', [3, 5, 7, 9, 11], [3, 7]),
+}
+
+
+def seed_everything(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def measure(case, size, seed, repeat):
+    """Median wall time over `repeat` runs, then one traced run for peak memory"""
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):  # Demos print per step; keep stdout off the clock
+        seed_everything(seed)
+        case(size, seed)[0]()  # Warm-up: lazy backend imports and operator caches stay out of the timings
+        for _ in range(repeat):
+            seed_everything(seed)
+            fn, ops = case(size, seed)
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+
+        seed_everything(seed)
+        fn, ops = case(size, seed)
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    wall = statistics.median(times)
+    return {'wall_time_s': wall, 'peak_memory_bytes': peak, 'ops': ops, 'ops_per_sec': ops / wall if wall else None}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(names, quick=False, seed=1234, repeat=3):
+    results = {'meta': {'commit': git_commit(), 'timestamp': datetime.now().isoformat(), 'seed': seed,
+                        'repeat': repeat, 'python': platform.python_version(), 'platform': platform.platform(),
+                        'numpy': np.__version__},
+               'algorithms': {}}
+    for name in names:
+        case, param, full, short = SUITE[name]
+        curve = []
+        for size in (short if quick else full):
+            try:
+                point = measure(case, size, seed, repeat)
+            except Exception as e:  # Record and keep sweeping; one broken demo must not hide the rest
+                point = {'error': f"{type(e).__name__}: {e}"}
+            point[param] = size
+            curve.append(point)
+            if 'error' in point:
+                print(f"{name:14} {param}={size:<5} ERROR {point['error']}")
+                break  # Larger sizes will fail the same way
+            print(f"{name:14} {param}={size:<5} {point['wall_time_s'] * 1000:10.2f} ms "
+                  f"{point['peak_memory_bytes'] / 2**20:9.2f} MiB {point['ops_per_sec']:12.1f} ops/s")
+        results['algorithms'][name] = {'parameter': param, 'points': curve}
+    return results
+
+
+def compare(current, baseline, threshold):
+    """Regressions where wall time or peak memory grew by more than `threshold` (fraction)"""
+    regressions = []
+    for name, algo in current['algorithms'].items():
+        param = algo['parameter']
+        base_points = {p[param]: p for p in baseline.get('algorithms', {}).get(name, {}).get('points', [])}
+        for point in algo['points']:
+            base = base_points.get(point[param])
+            if not base or 'error' in base or 'error' in point:
+                continue
+            for metric in ('wall_time_s', 'peak_memory_bytes'):
+                if base[metric] and point[metric] > base[metric] * (1 + threshold):
+                    regressions.append(f"{name} {param}={point[param]} {metric}: "
+                                       f"{base[metric]:.4g} → {point[metric]:.4g} "
+                                       f"(+{(point[metric] / base[metric] - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Valence-driven algorithm scaling benchmarks')
+    parser.add_argument('algorithms', nargs='*', metavar='ALGORITHM',
+                        help=f"Subset to run (default: all): {', '.join(SUITE)}")
+    parser.add_argument('--quick', action='store_true', help='Short size sweeps')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('-o', '--output', help='Results JSON (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='Baseline results JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed slowdown fraction (default 0.2)')
+    args = parser.parse_args(argv)
+    unknown = set(args.algorithms) - set(SUITE)
+    if unknown:
+        parser.error(f"unknown algorithm(s): {', '.join(sorted(unknown))}")
+
+    results = run_suite(args.algorithms or list(SUITE), quick=args.quick, seed=args.seed, repeat=args.repeat)
+
+    output = args.output or os.path.join(ROOT, 'benchmarks', 'results', f"{results['meta']['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=4)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
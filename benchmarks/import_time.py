@@ -0,0 +1,56 @@
+"""Startup benchmark: consensus-only CLI commands must not pay for the scientific stack
+
+    python benchmarks/import_time.py --runs 15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = ("import sys, main, lazy_backends; main.main(sys.argv[1:]); "
+         "print('LOADED=' + ','.join(lazy_backends.loaded_backends()))")
+
+
+def time_command(argv, runs):
+    samples, loaded = [], None
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run(argv, cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        samples.append((time.perf_counter() - start) * 1000)
+        loaded = [line[7:] for line in out.splitlines() if line.startswith('LOADED=')] or loaded
+    return statistics.median(samples), (loaded[0].split(',') if loaded and loaded[0] else [])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        receipts = os.path.join(tmp, 'receipts.json')
+        with open(receipts, 'w') as f:
+            json.dump([], f)
+        cases = {
+            'python (interpreter only)': ([sys.executable, '-c', 'pass'], None),
+            'patsagi receipts': ([sys.executable, '-c', PROBE, 'receipts', '--file', receipts], 'consensus'),
+        }
+        failed = False
+        for label, (argv_, kind) in cases.items():
+            ms, loaded = time_command(argv_, args.runs)
+            print(f"{label:32} {ms:8.1f} ms   heavy backends loaded: {', '.join(loaded) or 'none'}")
+            if kind == 'consensus' and loaded:
+                failed = True
+    if failed:
+        print("FAIL: consensus-only command imported heavy backends")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""QAOA warm start vs random starts: objective evaluations to COBYLA convergence
+
+For every seed and depth p, the random baseline starts optimize_qaoa from seeded
+uniform angles. The depth sweep instead seeds p+1 from the interpolated
+depth-p optimum. With --transfer-from N, a library is first filled by a
+sweep at N qubits, and the target size then starts from those angles.
+
+    python benchmarks/qaoa_warm_start.py --num-qubits 6 --max-layers 5 --seeds 3
+    python benchmarks/qaoa_warm_start.py --num-qubits 8 --max-layers 4 --transfer-from 5
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from qaoa_parameters import ParameterLibrary
+from valence_driven_qaoa import ValenceDrivenQAOA
+
+MEMBERS = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
+PROPOSAL = {'description': 'QAOA warm-start benchmark'}
+
+
+def random_starts(num_qubits, max_layers, seed):
+    rows = {}
+    for p in range(1, max_layers + 1):
+        qaoa = ValenceDrivenQAOA(MEMBERS, num_qubits=num_qubits, layers=p, shard_seed=seed)
+        _, valence = qaoa.optimize_qaoa(PROPOSAL)
+        rows[p] = (qaoa.last_run['evaluations'], valence)
+    return rows
+
+
+def warm_sweep(num_qubits, max_layers, seed, library):
+    qaoa = ValenceDrivenQAOA(MEMBERS, num_qubits=num_qubits, shard_seed=seed, warm_start=True, library=library)
+    return {p: (evaluations, valence) for p, _, valence, evaluations in qaoa.optimize_depths(PROPOSAL, max_layers)}
+
+
+def transfer_starts(num_qubits, max_layers, seed, library_path):
+    """Each depth at the target size, started from the smaller-size library (read-only, so depth p
+    never picks up the target-size optimum recorded at depth p-1)"""
+    library = ParameterLibrary(library_path, read_only=True)
+    rows = {}
+    for p in range(1, max_layers + 1):
+        qaoa = ValenceDrivenQAOA(MEMBERS, num_qubits=num_qubits, layers=p, shard_seed=seed, warm_start=True,
+                                 library=library)
+        _, valence = qaoa.optimize_qaoa(PROPOSAL)
+        rows[p] = (qaoa.last_run['evaluations'], valence)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--num-qubits', type=int, default=6)
+    parser.add_argument('--max-layers', type=int, default=5)
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--transfer-from', type=int, metavar='N', help='Also report size transfer from N qubits')
+    parser.add_argument('-o', '--output', help='Write the per-depth summary as JSON')
+    args = parser.parse_args(argv)
+
+    strategies = {'random': [], 'interpolated': []}
+    if args.transfer_from:
+        strategies['transfer'] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for seed in range(args.seeds):
+            strategies['random'].append(random_starts(args.num_qubits, args.max_layers, seed))
+            library = ParameterLibrary(os.path.join(tmp, f"sweep-{seed}.json"))
+            strategies['interpolated'].append(warm_sweep(args.num_qubits, args.max_layers, seed, library))
+            if args.transfer_from:
+                path = os.path.join(tmp, f"transfer-{seed}.json")
+                warm_sweep(args.transfer_from, args.max_layers, seed, ParameterLibrary(path))
+                strategies['transfer'].append(transfer_starts(args.num_qubits, args.max_layers, seed, path))
+
+    summary = {}
+    print(f"QAOA n={args.num_qubits}, mean over {args.seeds} seeds: evaluations (final valence)")
+    print(f"{'p':>3} " + ''.join(f"{name:>24}" for name in strategies))
+    for p in range(1, args.max_layers + 1):
+        summary[p] = {}
+        cells = []
+        for name, runs in strategies.items():
+            evals = statistics.mean(run[p][0] for run in runs)
+            valence = statistics.mean(run[p][1] for run in runs)
+            summary[p][name] = {'evaluations': evals, 'valence': valence}
+            cells.append(f"{evals:>12.1f} ({valence:.4f})")
+        print(f"{p:>3} " + ''.join(f"{c:>24}" for c in cells))
+    totals = {name: sum(summary[p][name]['evaluations'] for p in summary) for name in strategies}
+    print("Total evaluations: " + ' | '.join(f"{name} {total:.0f}" for name, total in totals.items()))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'num_qubits': args.num_qubits, 'seeds': args.seeds, 'per_depth': summary, 'totals': totals},
+                      f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""Local multi-node council: one process per node, receipts replicated over local sockets
+
+Node 0 is the leader. It sequences proposals in batches and broadcasts one
+PROPOSE message per batch. Each follower answers with a single VOTES
+message that covers all of its own members. The leader then tallies the
+receipts, chains them by prev_hash and broadcasts them in one RECEIPTS
+message. Followers check every receipt before applying it:
+  - the receipt_hash must match the contents
+  - prev_hash must equal the follower's current head
+  - the votes recorded for the follower's own members must be the ones it sent
+Each follower acknowledges with its head hash. Because receipts are chained
+and every node verifies each receipt's hash, equal heads mean identical logs.
+Before the first batch, every node (leader included) truncates its log at
+the first receipt that fails its hash. The leader then pulls any verified
+suffix a follower holds beyond its own log, and catches up every follower
+whose log is a prefix of the leader's.
+
+    python main.py cluster --nodes 3 --proposals 500 --batch-size 32
+"""
+import hashlib
+import json
+import os
+import queue
+import random
+import threading
+import time
+from multiprocessing import Process
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from statistics import median
+
+from instrumentation import count, get_logger, metrics, span
+from valence_consensus_module import PATSAGiValenceCouncil
+
+log = get_logger('replication')
+
+
+def simulated_ballot(member, proposal):
+    """Deterministic per (member, proposal) vote, so every run of a cluster is replayable"""
+    digest = hashlib.sha256(f"{member}|{json.dumps(proposal, sort_keys=True)}".encode()).digest()
+    rng = random.Random(digest)
+    return {'joy': 0.9 + 0.1 * rng.random(), 'mercy': 0.95 + 0.05 * rng.random(),
+            'sustain': 0.9 + 0.1 * rng.random(), 'veto': rng.random() < 0.01}
+
+
+def head_hash(receipts):
+    return receipts[-1]['receipt_hash'] if receipts else None
+
+
+def _observe(name, seconds):
+    if metrics.enabled:
+        metrics.observe(name, seconds)
+
+
+class ReplicaNode:
+    """One council node: its share of the members plus a full copy of the receipt log"""
+    def __init__(self, node_id, members, receipt_file, threshold=0.97, shard_seed=None, ballot=simulated_ballot):
+        self.node_id = node_id
+        self.council = PATSAGiValenceCouncil(members=members, receipt_file=receipt_file, threshold=threshold,
+                                             shard_seed=shard_seed, ballot=ballot)
+        self.conflicts = []
+
+    @property
+    def receipts(self):
+        return self.council.receipts
+
+    def truncate_invalid(self):
+        """Drop the local log from its first receipt whose hash doesn't match (repaired by catch-up)"""
+        for i, receipt in enumerate(self.receipts):
+            if not PATSAGiValenceCouncil.verify_receipt(receipt):
+                self.conflicts.append({'seq': receipt.get('seq', i), 'kind': 'corrupt'})
+                count('replication.conflicts')
+                log.warning(f"Node {self.node_id}: receipt {i} fails its hash — truncating local log for catch-up")
+                del self.receipts[i:]
+                break
+
+    def vote_batch(self, batch):
+        """{seq: {member: vote}} for this node's members across a whole batch"""
+        return {seq: self.council.cast_votes(proposal) for seq, proposal in batch}
+
+    def apply(self, receipts, sent_votes=None):
+        """Append verified receipts; returns the conflicts found (conflicting receipts are not applied)"""
+        conflicts = []
+        for receipt in receipts:
+            seq = receipt.get('seq')
+            if not PATSAGiValenceCouncil.verify_receipt(receipt):
+                conflicts.append({'seq': seq, 'kind': 'hash', 'receipt_hash': receipt.get('receipt_hash')})
+            elif 'prev_hash' in receipt and receipt['prev_hash'] != head_hash(self.receipts):
+                conflicts.append({'seq': seq, 'kind': 'fork', 'expected': head_hash(self.receipts),
+                                  'got': receipt['prev_hash']})
+            elif sent_votes and any(receipt['votes'].get(m) != v for m, v in sent_votes.get(seq, {}).items()):
+                conflicts.append({'seq': seq, 'kind': 'votes', 'receipt_hash': receipt['receipt_hash']})
+            else:
+                self.receipts.append(receipt)
+                continue
+            count('replication.conflicts')
+            log.warning(f"Node {self.node_id}: {conflicts[-1]['kind']} conflict at seq {seq}")
+        if receipts:
+            self.council.save_receipts()  # One write per batch, not per receipt
+        self.conflicts.extend(conflicts)
+        return conflicts
+
+
+def run_follower(address, authkey, node_id, members, receipt_file, threshold=0.97):
+    """Follower process main loop: vote on PROPOSE, verify/apply RECEIPTS, ACK with head hash"""
+    node = ReplicaNode(node_id, members, receipt_file, threshold)
+    node.truncate_invalid()
+    sent = {}
+    with Client(address, authkey=authkey) as conn:
+        conn.send(('hello', node_id, len(node.receipts), head_hash(node.receipts)))
+        while True:
+            message = conn.recv()
+            kind = message[0]
+            if kind == 'propose':
+                _, batch_id, batch = message
+                sent = node.vote_batch(batch)
+                conn.send(('votes', batch_id, node_id, sent))
+            elif kind == 'receipts':
+                _, batch_id, receipts = message
+                conflicts = node.apply(receipts, sent)
+                conn.send(('ack', batch_id, node_id, len(node.receipts), head_hash(node.receipts), conflicts))
+            elif kind == 'fetch':
+                conn.send(('log', node.receipts[message[1]:]))
+            elif kind == 'stop':
+                break
+
+
+def _accept_all(listener, n, pending):
+    """Accept n connections into a queue (Listener.accept has no timeout, so it runs off the main thread)"""
+    for _ in range(n):
+        try:
+            pending.put(listener.accept())
+        except OSError as e:  # Listener closed by stop()
+            pending.put(e)
+            return
+
+
+class LocalCluster:
+    """Leader (in this process) plus follower processes on localhost sockets
+
+    Every node keeps its own receipt file under workdir (receipts-node<N>.json).
+    Members are dealt round-robin across the nodes. start() fails instead of
+    waiting forever when a follower exits (e.g. on an unreadable receipt file)
+    or has not connected within connect_timeout seconds.
+    """
+    def __init__(self, members, nodes=3, workdir='council_cluster', threshold=0.97, shard_seed=None,
+                 connect_timeout=60.0):
+        if nodes < 1 or nodes > len(members):
+            raise ValueError(f"Need 1..{len(members)} nodes for {len(members)} members, got {nodes}")
+        self.workdir = Path(workdir)
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.connect_timeout = connect_timeout
+        self.assignments = [members[i::nodes] for i in range(nodes)]
+        self.leader = ReplicaNode(0, self.assignments[0], self.receipt_file(0), threshold, shard_seed)
+        self.authkey = os.urandom(16)
+        self.listener = None
+        self.connections = {}
+        self.processes = []
+        self.heads = {}
+        self.lags = []
+
+    def receipt_file(self, node_id):
+        return str(self.workdir / f"receipts-node{node_id}.json")
+
+    def start(self):
+        self.listener = Listener(('localhost', 0), authkey=self.authkey)
+        for node_id in range(1, len(self.assignments)):
+            proc = Process(target=run_follower, daemon=True,
+                           args=(self.listener.address, self.authkey, node_id, self.assignments[node_id],
+                                 self.receipt_file(node_id), self.threshold))
+            proc.start()
+            self.processes.append(proc)
+        self.leader.truncate_invalid()
+        pending = queue.Queue()
+        threading.Thread(target=_accept_all, args=(self.listener, len(self.processes), pending), daemon=True).start()
+        try:
+            hellos = {}
+            deadline = time.monotonic() + self.connect_timeout
+            for _ in self.processes:
+                conn = self.next_connection(pending, deadline)
+                _, node_id, length, head = conn.recv()
+                self.connections[node_id] = conn
+                hellos[node_id] = (length, head)
+            self.recover_leader(hellos)
+            for node_id, (length, head) in hellos.items():
+                self.catch_up(node_id, length, head)
+        except BaseException:
+            self.stop()
+            raise
+        return self
+
+    def next_connection(self, pending, deadline):
+        """Next accepted follower connection, checking while waiting that every follower is still running"""
+        while True:
+            try:
+                conn = pending.get(timeout=0.1)
+            except queue.Empty:
+                for node_id, proc in enumerate(self.processes, start=1):
+                    if proc.exitcode is not None:
+                        raise RuntimeError(f"Node {node_id} exited with code {proc.exitcode} "
+                                           "before joining the cluster")
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Followers did not connect within {self.connect_timeout}s")
+                continue
+            if isinstance(conn, Exception):
+                raise conn
+            return conn
+
+    def recover_leader(self, hellos):
+        """Extend the leader's log from the longest follower log that verifies on top of it"""
+        for node_id, (length, _) in sorted(hellos.items(), key=lambda h: -h[1][0]):
+            start = len(self.leader.receipts)
+            if length <= start:
+                return
+            conn = self.connections[node_id]
+            conn.send(('fetch', start))
+            _, suffix = conn.recv()
+            if suffix and not self.leader.apply(suffix):
+                log.info(f"Leader recovered receipts {start}..{length - 1} from node {node_id}")
+                return
+            del self.leader.receipts[start:]  # Partially applied suffix from a diverged follower
+            self.leader.council.save_receipts()
+
+    def log_valid(self):
+        """Every receipt in the leader's log matches its hash and chains onto its predecessor"""
+        receipts = self.leader.receipts
+        return all(PATSAGiValenceCouncil.verify_receipt(r) and
+                   ('prev_hash' not in r or r['prev_hash'] == (receipts[i - 1]['receipt_hash'] if i else None))
+                   for i, r in enumerate(receipts))
+
+    def catch_up(self, node_id, length, head):
+        """Ship the leader's log suffix to a follower whose log is a prefix of it"""
+        receipts = self.leader.receipts
+        if length > len(receipts) or (length and receipts[length - 1]['receipt_hash'] != head):
+            count('replication.conflicts')
+            raise RuntimeError(f"Node {node_id} log diverges from the leader at or before receipt {length}")
+        conn = self.connections[node_id]
+        conn.send(('receipts', -1, receipts[length:]))
+        _, _, _, new_length, head, conflicts = conn.recv()
+        self.heads[node_id] = (new_length, head)
+        if conflicts:
+            raise RuntimeError(f"Node {node_id} rejected {len(conflicts)} receipts during catch-up: {conflicts[0]}")
+        if new_length > length:
+            log.info(f"Node {node_id} caught up from {length} to {new_length} receipts")
+
+    def broadcast(self, message):
+        for conn in self.connections.values():
+            conn.send(message)
+        count('replication.messages', len(self.connections))
+
+    def replicate_batch(self, batch_id, batch, fork_context=None):
+        """One PROPOSE → VOTES → RECEIPTS → ACK round for a batch of (seq, proposal)"""
+        with span('replication.batch'):
+            self.broadcast(('propose', batch_id, batch))
+            votes = self.leader.vote_batch(batch)
+            for conn in self.connections.values():
+                _, _, _, node_votes = conn.recv()
+                for seq, member_votes in node_votes.items():
+                    votes[seq].update(member_votes)
+
+            council = self.leader.council
+            receipts = []
+            for seq, proposal in batch:
+                receipt = council.build_receipt(proposal, votes[seq], fork_context, seq=seq,
+                                                prev_hash=head_hash(council.receipts))
+                council.receipts.append(receipt)
+                receipts.append(receipt)
+            council.save_receipts()
+            committed = time.perf_counter()
+
+            self.broadcast(('receipts', batch_id, receipts))
+            conflicts = []
+            for conn in self.connections.values():
+                _, _, node_id, length, head, node_conflicts = conn.recv()
+                lag = time.perf_counter() - committed
+                self.lags.append(lag)
+                _observe('replication.lag', lag)
+                self.heads[node_id] = (length, head)
+                conflicts.extend(dict(c, node=node_id) for c in node_conflicts)
+        count('replication.receipts', len(receipts))
+        return receipts, conflicts
+
+    def run(self, proposals, batch_size=16, fork_context=None):
+        """Replicate all proposals; returns throughput, lag and convergence stats"""
+        start_seq = len(self.leader.receipts)
+        conflicts = []
+        started = time.perf_counter()
+        for batch_id, offset in enumerate(range(0, len(proposals), batch_size)):
+            batch = [(start_seq + offset + i, p) for i, p in enumerate(proposals[offset:offset + batch_size])]
+            _, batch_conflicts = self.replicate_batch(batch_id, batch, fork_context)
+            conflicts.extend(batch_conflicts)
+        elapsed = time.perf_counter() - started
+
+        leader_head = (len(self.leader.receipts), head_hash(self.leader.receipts))
+        lags = sorted(self.lags)
+        stats = {
+            'nodes': len(self.assignments),
+            'receipts': len(proposals),
+            'batches': -(-len(proposals) // batch_size),
+            'seconds': round(elapsed, 4),
+            'receipts_per_s': round(len(proposals) / elapsed, 1) if elapsed else None,
+            'lag_p50_ms': round(median(lags) * 1e3, 3) if lags else None,
+            'lag_max_ms': round(lags[-1] * 1e3, 3) if lags else None,
+            'conflicts': conflicts,
+            'head_hash': leader_head[1],
+            'converged': not conflicts and self.log_valid() and all(h == leader_head for h in self.heads.values()),
+        }
+        log.info(f"Replicated {stats['receipts']} receipts across {stats['nodes']} nodes in {stats['batches']} "
+                 f"batches: {stats['receipts_per_s']} receipts/s | lag p50 {stats['lag_p50_ms']} ms, "
+                 f"max {stats['lag_max_ms']} ms | conflicts {len(conflicts)} | converged {stats['converged']}")
+        return stats
+
+    def stop(self):
+        self.broadcast(('stop',))
+        for conn in self.connections.values():
+            conn.close()
+        for proc in self.processes:
+            proc.join(timeout=10)
+            if proc.is_alive():  # Never connected, so never got STOP
+                proc.terminate()
+        if self.listener:
+            self.listener.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,129 @@
+import contextlib
+import functools
+import json
+import logging
+import sys
+import threading
+import time
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class Metrics:
+    """Process-wide spans and counters; every call is a cheap no-op until enable()
+
+    Spans aggregate (calls, total seconds, max seconds) per name. With a
+    JSON-lines sink each finished span is also written as one event.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.spans = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._sink = None
+
+    def enable(self, jsonl_path=None):
+        self.enabled = True
+        if jsonl_path:
+            self._sink = open(jsonl_path, 'a', buffering=1 << 16)
+
+    def disable(self):
+        self.enabled = False
+        if self._sink:
+            self._sink.close()
+            self._sink = None
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+
+    def span(self, name):
+        return self._span(name) if self.enabled else _NULL_SPAN
+
+    @contextlib.contextmanager
+    def _span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name, seconds):
+        with self._lock:
+            calls, total, peak = self.spans.get(name, (0, 0.0, 0.0))
+            self.spans[name] = (calls + 1, total + seconds, max(peak, seconds))
+            if self._sink:
+                self._sink.write(json.dumps({'ts': time.time(), 'span': name, 'seconds': seconds}) + '\n')
+
+    def count(self, name, value=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def timed(self, name):
+        """Decorator form of span()"""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with self._span(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        with self._lock:
+            return {'spans': {k: {'calls': c, 'total_s': t, 'max_s': m} for k, (c, t, m) in self.spans.items()},
+                    'counters': dict(self.counters)}
+
+    def to_prometheus(self, prefix='patsagi'):
+        lines = [f"# TYPE {prefix}_span_seconds_total counter",
+                 f"# TYPE {prefix}_span_calls_total counter",
+                 f"# TYPE {prefix}_span_seconds_max gauge"]
+        snap = self.snapshot()
+        for name, s in sorted(snap['spans'].items()):
+            lines.append(f'{prefix}_span_seconds_total{{span="{name}"}} {s["total_s"]:.9f}')
+            lines.append(f'{prefix}_span_calls_total{{span="{name}"}} {s["calls"]}')
+            lines.append(f'{prefix}_span_seconds_max{{span="{name}"}} {s["max_s"]:.9f}')
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in sorted(snap['counters'].items()):
+            lines.append(f'{prefix}_events_total{{name="{name}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path):
+        """Prometheus text format for *.prom/*.txt, otherwise one JSON line per metric"""
+        if path.endswith(('.prom', '.txt')):
+            with open(path, 'w') as f:
+                f.write(self.to_prometheus())
+            return path
+        snap = self.snapshot()
+        with open(path, 'a') as f:
+            for name, s in snap['spans'].items():
+                f.write(json.dumps({'type': 'span', 'name': name, **s}) + '\n')
+            for name, value in snap['counters'].items():
+                f.write(json.dumps({'type': 'counter', 'name': name, 'value': value}) + '\n')
+        return path
+
+
+metrics = Metrics()
+span = metrics.span
+count = metrics.count
+timed = metrics.timed
+
+
+def get_logger(name):
+    return logging.getLogger(f"patsagi.{name}")
+
+
+def configure_logging(level=logging.INFO):
+    """Plain message-only output on stdout, like the original print() calls"""
+    root = logging.getLogger('patsagi')
+    if not any(getattr(h, '_patsagi', False) for h in root.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler._patsagi = True
+        root.addHandler(handler)
+    root.setLevel(level)
+    return root
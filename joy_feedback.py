@@ -1,13 +1,321 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+import hashlib
+import io
+import json
+import os
+import time
 
-def joy_feedback(csv_file):
+import numpy as np
+
+from lazy_backends import lazy_import
+
+pd = lazy_import('pandas')
+
+JOY_DTYPES = {'member': 'string', 'joy_level': 'float32', 'needs_met': 'string', 'comments': 'string'}
+
+
+class JoyAggregates:
+    """Incremental joy sums/counts: global, per-member and per-time-window"""
+    def __init__(self, window='1h'):
+        self.window = window
+        self.offset = 0          # Byte offset of the next unread row in the source CSV
+        self.columns = None      # Header names, captured on first read
+        self.count = 0
+        self.total = 0.0
+        self.member_sum = pd.Series(dtype='float64')
+        self.member_count = pd.Series(dtype='int64')
+        self.window_sum = pd.Series(dtype='float64')
+        self.window_count = pd.Series(dtype='int64')
+
+    def update(self, chunk):
+        joy = chunk['joy_level'].astype('float64') / 10  # joy_normalized
+        valid = joy.notna()
+        joy = joy[valid]
+        self.count += int(joy.size)
+        self.total += float(joy.sum())
+
+        by_member = joy.groupby(chunk['member'][valid])
+        self.member_sum = self.member_sum.add(by_member.sum(), fill_value=0)
+        self.member_count = self.member_count.add(by_member.count(), fill_value=0).astype('int64')
+
+        stamps = pd.to_datetime(chunk['timestamp'][valid], errors='coerce')
+        by_window = joy.groupby(stamps.dt.floor(self.window))
+        self.window_sum = self.window_sum.add(by_window.sum(), fill_value=0).sort_index()
+        self.window_count = self.window_count.add(by_window.count(), fill_value=0).astype('int64').sort_index()
+
+    @property
+    def avg_joy(self):
+        return self.total / self.count if self.count else float('nan')
+
+    def member_means(self):
+        return self.member_sum / self.member_count
+
+    def window_means(self):
+        return self.window_sum / self.window_count
+
+
+def _record_end(block):
+    """Offset just past the last newline outside a quoted field (0 if the block holds no complete record)
+
+    block must start at a record boundary; a quote toggles the quoted state, so
+    an escaped "" cancels out and a newline ends a record when the number of
+    quotes before it is even.
+    """
+    quotes = block.count(b'"')  # Quotes before `end`
+    end = len(block)
+    while True:
+        newline = block.rfind(b'\n', 0, end)
+        if newline < 0:
+            return 0
+        quotes -= block.count(b'"', newline, end)
+        if quotes % 2 == 0:
+            return newline + 1
+        end = newline
+
+
+def _read_new_rows(csv_file, state, block_bytes):
+    """Yield DataFrames for complete rows appended since state.offset (partial tail records are left for later)"""
+    with open(csv_file, 'rb') as f:
+        if state.columns is None:
+            header = f.readline()
+            if not header.endswith(b'\n'):
+                return  # Header still being written
+            state.columns = pd.read_csv(io.BytesIO(header), nrows=0).columns.tolist()
+            state.offset = f.tell()
+        f.seek(state.offset)
+        carry = b''
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            block = carry + block
+            cut = _record_end(block)  # Newlines inside quoted comments don't end a record
+            carry = block[cut:]
+            if not cut:
+                continue
+            state.offset += cut
+            yield pd.read_csv(io.BytesIO(block[:cut]), header=None, names=state.columns,
+                              usecols=['timestamp', 'member', 'joy_level'],
+                              dtype={k: v for k, v in JOY_DTYPES.items() if k in state.columns})
+
+
+def stream_joy_feedback(csv_file, state=None, window='1h', block_bytes=64 * 2**20):
+    """Fold only the rows not yet seen by `state` into its aggregates; memory stays bounded by block_bytes"""
+    state = state or JoyAggregates(window=window)
+    for chunk in _read_new_rows(csv_file, state, block_bytes):
+        state.update(chunk)
+    return state
+
+
+def tail_joy_feedback(csv_file, state=None, window='1h', poll_interval=1.0, max_polls=None, on_update=None):
+    """Follow a continuously appended feedback log, processing new rows as they land"""
+    state = state or JoyAggregates(window=window)
+    polls = 0
+    last_size = -1
+    while max_polls is None or polls < max_polls:
+        size = os.path.getsize(csv_file) if os.path.exists(csv_file) else 0
+        if size < state.offset:
+            state = JoyAggregates(window=state.window)  # Log was truncated/rotated; start over
+        if size != last_size:
+            before = state.count
+            state = stream_joy_feedback(csv_file, state=state)
+            if state.count != before and on_update:
+                on_update(state)
+            last_size = size
+        polls += 1
+        if max_polls is None or polls < max_polls:
+            time.sleep(poll_interval)
+    return state
+
+
+class JoyCache:
+    """Sidecar columnar cache + hour/day/member rollups for one feedback CSV
+
+    Layout of `<csv>.joycache/`: meta.json (source size/mtime/offset/fingerprints,
+    committed row count per part), part-NNNNN.npz (timestamp ns, member,
+    joy_normalized columns), rollups.npz (pre-aggregated sums and counts).
+    Only rows past the cached offset are parsed, and they top up the last
+    part until it holds PART_ROWS rows, so frequent small appends don't pile
+    up tiny files. A truncated source, or a rewrite of its first or last
+    ingested FINGERPRINT_BYTES, rebuilds the cache. A same-size rewrite in
+    the middle of the ingested prefix is not detected, because that would
+    mean rehashing the whole prefix on every refresh.
+    """
+    FINGERPRINT_BYTES = 4096
+    PART_ROWS = 1 << 18
+    WINDOW = '1h'  # Rollups are hourly; 'day' is derived from them
+
+    def __init__(self, csv_file, cache_dir=None):
+        self.csv_file = csv_file
+        self.cache_dir = cache_dir or f"{csv_file}.joycache"
+        self.meta = None
+        self.state = JoyAggregates(window=self.WINDOW)
+
+    def _path(self, name):
+        return os.path.join(self.cache_dir, name)
+
+    def _fingerprint(self, nbytes, start=0):
+        with open(self.csv_file, 'rb') as f:
+            f.seek(start)
+            return hashlib.sha1(f.read(nbytes)).hexdigest()
+
+    def _save_npz(self, name, **arrays):
+        tmp = self._path(name + '.tmp.npz')
+        np.savez(tmp, **arrays)
+        os.replace(tmp, self._path(name))
+
+    def load(self):
+        try:
+            with open(self._path('meta.json'), 'r') as f:
+                self.meta = json.load(f)
+            r = np.load(self._path('rollups.npz'))
+        except (OSError, ValueError):
+            self.meta = None
+            self.state = JoyAggregates(window=self.WINDOW)
+            return False
+        state = JoyAggregates(window=self.WINDOW)
+        state.offset = self.meta['offset']
+        state.columns = self.meta['columns']
+        state.count = int(r['count'])
+        state.total = float(r['total'])
+        state.member_sum = pd.Series(r['member_sum'], index=r['members'].astype(str))
+        state.member_count = pd.Series(r['member_count'], index=r['members'].astype(str))
+        hours = pd.DatetimeIndex(r['hours'].astype('datetime64[ns]'))
+        state.window_sum = pd.Series(r['hour_sum'], index=hours)
+        state.window_count = pd.Series(r['hour_count'], index=hours)
+        self.state = state
+        return True
+
+    def _is_valid(self, stat):
+        m = self.meta
+        if m is None or 'part_rows' not in m or stat.st_size < m['offset']:
+            return False
+        nbytes = m['fingerprint_bytes']
+        return (self._fingerprint(nbytes) == m['fingerprint'] and
+                self._fingerprint(nbytes, m['offset'] - nbytes) == m.get('tail_fingerprint'))
+
+    def refresh(self, block_bytes=64 * 2**20):
+        """Bring the cache up to date with the source CSV and return the hourly JoyAggregates"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        stat = os.stat(self.csv_file)
+        if self.meta is None:
+            self.load()
+        if self.meta and (stat.st_size, stat.st_mtime_ns) == (self.meta['size'], self.meta['mtime_ns']):
+            return self.state  # Fast path: source untouched since last refresh
+        if not self._is_valid(stat):
+            for name in os.listdir(self.cache_dir):
+                os.remove(self._path(name))
+            self.meta = None
+            self.state = JoyAggregates(window=self.WINDOW)
+
+        parts = list(self.meta['part_rows']) if self.meta else []
+        for chunk in _read_new_rows(self.csv_file, self.state, block_bytes):
+            self.state.update(chunk)
+            stamps = pd.to_datetime(chunk['timestamp'], errors='coerce')
+            columns = {'timestamp': stamps.to_numpy(dtype='datetime64[ns]').view('int64'),
+                       'member': chunk['member'].fillna('').to_numpy(dtype=str),
+                       'joy_normalized': (chunk['joy_level'].astype('float64') / 10).to_numpy()}
+            if parts and parts[-1] < self.PART_ROWS:
+                # Rewrite the last part with the new rows; only its committed rows are kept, so a part
+                # rewritten by an interrupted refresh (meta not yet saved) never contributes rows twice
+                with np.load(self._path(f"part-{len(parts) - 1:05d}.npz")) as last:
+                    columns = {c: np.concatenate([last[c][:parts[-1]], v]) for c, v in columns.items()}
+                parts.pop()
+            self._save_npz(f"part-{len(parts):05d}.npz", **columns)
+            parts.append(len(columns['timestamp']))
+        self._save(stat, parts)
+        return self.state
+
+    def _save(self, stat, parts):
+        s = self.state
+        nbytes = min(self.FINGERPRINT_BYTES, s.offset)  # Only bytes already ingested, so appends keep it stable
+        self._save_npz('rollups.npz', count=s.count, total=s.total,
+                       members=s.member_sum.index.to_numpy(dtype=str),
+                       member_sum=s.member_sum.to_numpy(), member_count=s.member_count.to_numpy(),
+                       hours=s.window_sum.index.to_numpy(dtype='datetime64[ns]').view('int64'),
+                       hour_sum=s.window_sum.to_numpy(), hour_count=s.window_count.to_numpy())
+        self.meta = {'source': os.path.abspath(self.csv_file), 'size': stat.st_size,
+                     'mtime_ns': stat.st_mtime_ns, 'offset': s.offset, 'columns': s.columns,
+                     'fingerprint_bytes': nbytes, 'fingerprint': self._fingerprint(nbytes),
+                     'tail_fingerprint': self._fingerprint(nbytes, s.offset - nbytes), 'part_rows': parts}
+        tmp = self._path('meta.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.meta, f, indent=4)
+        os.replace(tmp, self._path('meta.json'))
+
+    def rollup(self, by='hour'):
+        """Pre-aggregated joy sum/count/mean by 'hour', 'day' or 'member'"""
+        s = self.state
+        if by == 'member':
+            sums, counts = s.member_sum, s.member_count
+        elif by == 'hour':
+            sums, counts = s.window_sum, s.window_count
+        elif by == 'day':
+            day = s.window_sum.index.floor('D')
+            sums, counts = s.window_sum.groupby(day).sum(), s.window_count.groupby(day).sum()
+        else:
+            raise ValueError(f"Unknown rollup: {by}")
+        return pd.DataFrame({'joy_sum': sums, 'count': counts, 'joy_mean': sums / counts})
+
+    def rows(self, columns=('timestamp', 'member', 'joy_normalized')):
+        """Cached columnar rows (no CSV parsing) as a DataFrame"""
+        frames = []
+        for i, n in enumerate(self.meta['part_rows'] if self.meta else []):
+            with np.load(self._path(f"part-{i:05d}.npz")) as part:
+                frames.append(pd.DataFrame({c: part[c][:n] for c in columns}))
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=list(columns))
+        if 'timestamp' in df:
+            df['timestamp'] = pd.to_datetime(df['timestamp'].astype('int64'), unit='ns')
+        return df
+
+
+def plot_joy(state, plot_file):
+    """Render per-window joy resonance headlessly to an image file"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    state.window_means().plot(kind='line', ax=ax, title='Joy Resonance Over Time')
+    ax.set_xlabel('timestamp')
+    ax.set_ylabel('joy_normalized')
+    fig.savefig(plot_file, bbox_inches='tight')
+    plt.close(fig)
+    return plot_file
+
+
+def joy_feedback(csv_file, stream=False, window='1h', plot_file=None, cache=False):
+    if cache:
+        if window != JoyCache.WINDOW:
+            raise ValueError(f"Cache mode keeps {JoyCache.WINDOW} rollups; window={window!r} needs stream mode")
+        state = JoyCache(csv_file).refresh()
+        avg_joy = state.avg_joy
+        print(f"Collective Joy Valence: {avg_joy:.4f} ({state.count} rows cached)")
+        if plot_file:
+            plot_joy(state, plot_file)
+        return avg_joy
+
+    if stream:
+        state = stream_joy_feedback(csv_file, window=window)
+        avg_joy = state.avg_joy
+        print(f"Collective Joy Valence: {avg_joy:.4f} ({state.count} rows, {len(state.member_sum)} members)")
+        if plot_file:
+            plot_joy(state, plot_file)
+        return avg_joy
+
+    if plot_file:
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
     df = pd.read_csv(csv_file)  # Columns: timestamp, member, joy_level (1-10), needs_met, comments
     df['joy_normalized'] = df['joy_level'] / 10
     avg_joy = df['joy_normalized'].mean()
     print(f"Collective Joy Valence: {avg_joy:.4f}")
 
     df.plot(kind='line', x='timestamp', y='joy_normalized', title='Joy Resonance Over Time')
-    plt.show()
+    if plot_file:
+        plt.savefig(plot_file)
+        plt.close()
+    else:
+        plt.show()
 
     return avg_joy
@@ -0,0 +1,39 @@
+import importlib
+import sys
+
+# Scientific stack that must stay out of consensus-only code paths
+HEAVY_BACKENDS = ('numpy', 'scipy', 'qutip', 'pandas', 'matplotlib', 'dimod', 'pulp')
+
+
+class LazyModule:
+    """Module proxy: the real import happens on first attribute access"""
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            name = self.__dict__['_name']
+            try:
+                module = importlib.import_module(name)
+            except ImportError as e:
+                raise ImportError(f"Backend '{name}' is required for this algorithm — pip install {name.split('.')[0]}") from e
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_module'] is not None else 'not loaded'
+        return f"<LazyModule '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def loaded_backends():
+    """Heavy backends already imported in this process"""
+    return [name for name in HEAVY_BACKENDS if name in sys.modules]
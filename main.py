@@ -1,2 +1,187 @@
-from valence_consensus_module import PATSAGiValenceCouncil
-# ... initialize and deliberate in simulation loops
+"""PATSAGi-Prototypes CLI — one entry point dispatching to the council and the demos
+
+Only the standard library is imported here; each demo's module (and its
+scientific backends) is loaded when that subcommand actually runs, so
+consensus-only commands such as `receipts` start in tens of milliseconds.
+
+    python main.py receipts --last 3
+    python main.py council --description "Shared vertical farm"
+    python main.py qaoa --set num_qubits=6 --set layers=2
+    python main.py --metrics-out qaoa.prom -q qaoa
+    python main.py cluster --nodes 3 --proposals 500
+"""
+import argparse
+import ast
+import importlib
+import logging
+import sys
+
+from instrumentation import configure_logging, metrics
+
+DEFAULT_MEMBERS = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
+
+# name → (module, class, method, default kwargs, takes council members, default proposal)
+DEMOS = {
+    'qaoa': ('valence_driven_qaoa', 'ValenceDrivenQAOA', 'optimize_qaoa', {'num_qubits': 5, 'layers': 4}, True,
+             'QAOA approximate optimization for combinatorial joy-maximization in valence fork graph'),
+    'vqe': ('valence_driven_vqe', 'ValenceDrivenVQE', 'optimize_for_thriving', {}, True,
+            'Optimize quantum ansatz parameters for maximum valence-joy amplification in hybrid mercy shards'),
+    'adiabatic': ('valence_driven_adiabatic', 'ValenceDrivenAdiabatic', 'evolve_adiabatically',
+                  {'num_qubits': 5, 'total_time': 200.0}, True,
+                  'Pure adiabatic evolution to exact valence-joy ground state in dissonance Hamiltonian'),
+    'qpe': ('valence_driven_qpe', 'ValenceDrivenQPE', 'estimate_phase', {'counting_qubits': 8}, True,
+            'QPE precise estimation of valence phase in dissonance evolution unitary'),
+    'qft': ('valence_driven_qft', 'ValenceDrivenQFT', 'apply_qft', {'num_qubits': 6}, True,
+            'QFT transformation of valence state to reveal periodic eternal joy harmonics'),
+    'qec': ('valence_driven_qec', 'ValenceDrivenQEC', 'fault_tolerant_run', {'code': 'shor'}, True,
+            'QEC fault-tolerant protection of logical valence qubit against dissonance errors'),
+    'grover': ('valence_driven_grover', 'ValenceDrivenGrover', 'grover_amplification', {'search_space_size': 16}, True,
+               'Search discrete configuration space for optimal joy-allocation state in hybrid mercy shards'),
+    'annealing': ('valence_driven_annealing', 'ValenceDrivenAnnealing', 'anneal_for_thriving', {'problem_size': 20}, True,
+                  'Anneal rugged combinatorial space for optimal joy-equity allocation in eternal mercy shards'),
+    'surface': ('valence_driven_surface_demo', 'ValenceSurfaceCodeDemo', 'run_demo', {'distance': 3}, False, None),
+    'surface-large': ('valence_driven_surface_large', 'ValenceLargeSurfaceCodeDemo', 'run_large_demo',
+                      {'distance': 5}, False, None),
+}
+
+
+def parse_setting(text):
+    """KEY=VALUE with VALUE parsed as a Python literal when possible"""
+    key, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got {text!r}")
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+    return key, value
+
+
+def run_receipts(args):
+    from valence_consensus_module import PATSAGiValenceCouncil
+    receipts = PATSAGiValenceCouncil(members=[], receipt_file=args.file).receipts
+    shown = receipts[-args.last:] if args.last else receipts
+    for r in shown:
+        status = 'APPROVED' if r.get('approved') else 'REFINE'
+        print(f"{r.get('timestamp', '?')} | {status:8} | valence {r.get('avg_valence', 0):.4f} | "
+              f"{r.get('receipt_hash', '')[:16]} | {r.get('proposal', {}).get('description', '')}")
+    print(f"Stacked Eternal Receipts: {len(receipts)}")
+
+
+def run_council(args):
+    from valence_consensus_module import PATSAGiValenceCouncil
+    council = PATSAGiValenceCouncil(members=args.members, receipt_file=args.file, threshold=args.threshold,
+                                    shard_seed=args.shard_seed)
+    description = args.description or input("Proposal description: ")
+    return council.deliberate({'description': description}, fork_context=args.fork_context)
+
+
+def run_cluster(args):
+    from council_replication import LocalCluster
+    proposals = [{'description': f"{args.description} #{i}"} for i in range(args.proposals)]
+    with LocalCluster(args.members, nodes=args.nodes, workdir=args.dir, threshold=args.threshold,
+                      shard_seed=args.shard_seed) as cluster:
+        stats = cluster.run(proposals, batch_size=args.batch_size)
+    for conflict in stats['conflicts']:
+        print(f"  CONFLICT node {conflict['node']} seq {conflict['seq']}: {conflict['kind']}")
+    print(f"Head {stats['head_hash']} | converged: {stats['converged']}")
+    return stats
+
+
+def run_demo(args):
+    module_name, class_name, method, defaults, with_council, default_description = DEMOS[args.command]
+    cls = getattr(importlib.import_module(module_name), class_name)
+    kwargs = dict(defaults, **dict(args.set or []))
+    if with_council:
+        instance = cls(council_members=args.members, **kwargs)
+        proposal = {'description': args.description or default_description}
+        return getattr(instance, method)(proposal)
+    return getattr(cls(**kwargs), method)()
+
+
+def run_joy(args):
+    from joy_feedback import joy_feedback
+    return joy_feedback(args.csv_file, stream=args.stream, window=args.window, plot_file=args.plot, cache=args.cache)
+
+
+def run_thunder(args):
+    from models.eternal_abundance_economics_model_2026 import EternalAbundanceEconomy
+    summary = EternalAbundanceEconomy().monte_carlo_thunder(simulations=args.simulations, seed=args.seed,
+                                                            processes=args.processes)
+    for k, v in summary.items():
+        print(f"  {k.replace('_', ' ').capitalize()}: {v}")
+    return summary
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='patsagi', description='PATSAGi valence council and quantum demos')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Per-iteration debug output')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Warnings only')
+    parser.add_argument('--metrics-out', metavar='PATH',
+                        help='Record timing spans/counters; *.prom → Prometheus text, *.jsonl → JSON lines')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('receipts', help='Print stacked council receipts')
+    p.add_argument('--file', default='agi_patsagi_receipts.json')
+    p.add_argument('--last', type=int, default=0, help='Only the last N receipts')
+    p.set_defaults(func=run_receipts)
+
+    p = sub.add_parser('council', help='Run one interactive council deliberation')
+    p.add_argument('--members', nargs='+', default=DEFAULT_MEMBERS)
+    p.add_argument('--file', default='agi_patsagi_receipts.json')
+    p.add_argument('--threshold', type=float, default=0.97)
+    p.add_argument('--description')
+    p.add_argument('--fork-context')
+    p.add_argument('--shard-seed', type=int, help='Seed the mercy shard stream (recorded in the receipt)')
+    p.set_defaults(func=run_council)
+
+    p = sub.add_parser('cluster', help='Replicated multi-process council on localhost (simulated ballots)')
+    p.add_argument('--members', nargs='+', default=DEFAULT_MEMBERS)
+    p.add_argument('--nodes', type=int, default=3)
+    p.add_argument('--proposals', type=int, default=100)
+    p.add_argument('--batch-size', type=int, default=16)
+    p.add_argument('--dir', default='council_cluster', help='Per-node receipt files go here')
+    p.add_argument('--threshold', type=float, default=0.97)
+    p.add_argument('--description', default='Replicated abundance proposal')
+    p.add_argument('--shard-seed', type=int)
+    p.set_defaults(func=run_cluster)
+
+    for name, (module_name, *_rest) in DEMOS.items():
+        p = sub.add_parser(name, help=f'Run the {module_name} demo')
+        p.add_argument('--members', nargs='+', default=DEFAULT_MEMBERS)
+        p.add_argument('--description', help='Proposal description')
+        p.add_argument('--set', action='append', type=parse_setting, metavar='KEY=VALUE',
+                       help='Constructor argument override (repeatable)')
+        p.set_defaults(func=run_demo)
+
+    p = sub.add_parser('joy', help='Collective joy valence from a feedback CSV')
+    p.add_argument('csv_file')
+    p.add_argument('--stream', action='store_true')
+    p.add_argument('--cache', action='store_true')
+    p.add_argument('--window', default='1h')
+    p.add_argument('--plot', help='Render the plot headlessly to this file')
+    p.set_defaults(func=run_joy)
+
+    p = sub.add_parser('thunder', help='Eternal abundance Monte Carlo')
+    p.add_argument('--simulations', type=int, default=2000)
+    p.add_argument('--seed', type=int)
+    p.add_argument('--processes', type=int)
+    p.set_defaults(func=run_thunder)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    configure_logging(logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO)
+    if not args.metrics_out:
+        return args.func(args)
+    metrics.enable(jsonl_path=args.metrics_out if args.metrics_out.endswith('.jsonl') else None)
+    try:
+        return args.func(args)
+    finally:
+        metrics.disable()
+        metrics.export(args.metrics_out)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
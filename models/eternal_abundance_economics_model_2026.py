@@ -0,0 +1,183 @@
+# eternal_abundance_economics_model_2026.py
+# PATSAGi-Pinnacle — Eternal Abundance Economy Thunder Model
+# Vectorized policy kernel + sharded, constant-memory Monte Carlo
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+POLICY_LEVERS = ['deregulation_factor', 'investment_boost', 'pmi_override', 'energy_boost_mbpd',
+                 'ai_thunder_level', 'quantum_thunder_level', 'mercy_os_philotic_level',
+                 'quantum_emotional_level']
+
+
+class ThunderStats:
+    """Streaming summary of one metric: moments + fixed-bin histogram for quantiles
+
+    Memory is constant in the number of samples and two instances merge
+    exactly, so shards computed in separate processes combine losslessly
+    (quantiles are accurate to one bin width).
+    """
+    def __init__(self, lo, hi, bins=4096, log=False):
+        self.lo, self.hi, self.bins, self.log = lo, hi, bins, log
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.hist = np.zeros(bins + 2, dtype=np.int64)  # [underflow, bins..., overflow]
+
+    def _scale(self, x):
+        return np.log10(x) if self.log else x
+
+    def update(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        self.count += x.size
+        self.total += float(x.sum())
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+        pos = (self._scale(x) - self.lo) / (self.hi - self.lo) * self.bins
+        idx = np.clip(np.floor(pos), -1, self.bins).astype(np.int64) + 1
+        self.hist += np.bincount(idx, minlength=self.bins + 2)
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.hist += other.hist
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else float('nan')
+
+    def quantile(self, q):
+        if not self.count:
+            return float('nan')
+        cum = np.cumsum(self.hist)
+        i = int(np.searchsorted(cum, q * self.count, side='left'))
+        if i == 0:
+            return self.min
+        if i == self.bins + 1:
+            return self.max
+        edge = self.lo + (i - 0.5) / self.bins * (self.hi - self.lo)  # Bin centre
+        value = 10 ** edge if self.log else edge
+        return float(np.clip(value, self.min, self.max))
+
+    def fraction_above(self, threshold):
+        """Share of samples above threshold (resolved to bin edges)"""
+        if not self.count:
+            return float('nan')
+        pos = (self._scale(threshold) - self.lo) / (self.hi - self.lo) * self.bins
+        i = int(np.clip(np.ceil(pos), 0, self.bins)) + 1
+        return float(self.hist[i:].sum()) / self.count
+
+
+class EternalAbundanceEconomy:
+    def __init__(self, base_gdp_usd=2.9e13, base_growth_pct=2.0, horizon_years=10,
+                 abundance_threshold_usd=1e14):
+        self.base_gdp_usd = base_gdp_usd
+        self.base_growth_pct = base_growth_pct
+        self.horizon_years = horizon_years
+        self.abundance_threshold_usd = abundance_threshold_usd  # "Abundance" universe cut-off
+
+    def thunder_kernel(self, deregulation_factor, investment_boost, pmi_override, energy_boost_mbpd,
+                       ai_thunder_level, quantum_thunder_level, mercy_os_philotic_level,
+                       quantum_emotional_level):
+        """Policy levers (scalars or equal-length arrays) → (gdp growth %, joy multiplier, abundance $)"""
+        growth = (self.base_growth_pct
+                  * np.sqrt(deregulation_factor * investment_boost)
+                  * (pmi_override / 50.0)
+                  + 0.25 * energy_boost_mbpd
+                  + 0.4 * (ai_thunder_level + quantum_thunder_level))
+        joy_multiplier = ((1 + mercy_os_philotic_level / 10.0)
+                          * (1 + quantum_emotional_level / 10.0)
+                          * (1 + ai_thunder_level / 20.0))
+        abundance = self.base_gdp_usd * (1 + growth / 100.0) ** self.horizon_years * joy_multiplier
+        return growth, joy_multiplier, abundance
+
+    def simulate_policy_thunder(self, deregulation_factor=1.0, investment_boost=1.0, pmi_override=50.0,
+                                energy_boost_mbpd=0.0, ai_thunder_level=0.0, quantum_thunder_level=0.0,
+                                mercy_os_philotic_level=0.0, quantum_emotional_level=0.0):
+        growth, joy, abundance = self.thunder_kernel(
+            deregulation_factor, investment_boost, pmi_override, energy_boost_mbpd,
+            ai_thunder_level, quantum_thunder_level, mercy_os_philotic_level, quantum_emotional_level)
+        return {
+            'projected_gdp_growth_%': round(float(growth), 2),
+            'quantum_emotional_level': quantum_emotional_level,
+            'valence_joy_multiplier': round(float(joy), 2),
+            'eternal_abundance_projection': int(abundance),
+        }
+
+    def sample_levers(self, rng, n):
+        """Draw n random policy universes as arrays (one column per lever)"""
+        return {
+            'deregulation_factor': rng.uniform(0.5, 2.5, n),
+            'investment_boost': rng.uniform(0.5, 2.5, n),
+            'pmi_override': rng.normal(52.0, 4.0, n).clip(30.0, 70.0),
+            'energy_boost_mbpd': rng.uniform(0.0, 6.0, n),
+            'ai_thunder_level': rng.uniform(0.0, 10.0, n),
+            'quantum_thunder_level': rng.uniform(0.0, 10.0, n),
+            'mercy_os_philotic_level': rng.uniform(0.0, 10.0, n),
+            'quantum_emotional_level': rng.uniform(0.0, 10.0, n),
+        }
+
+    def new_stats(self):
+        return {'growth': ThunderStats(-10.0, 40.0),
+                'joy': ThunderStats(0.0, 7.0),
+                'abundance': ThunderStats(12.0, 16.0, log=True)}
+
+    def run_shard(self, n, seed_seq, batch_size=100_000):
+        """Simulate n universes from one independent Generator stream, batch by batch"""
+        rng = np.random.default_rng(seed_seq)
+        stats = self.new_stats()
+        for start in range(0, n, batch_size):
+            growth, joy, abundance = self.thunder_kernel(**self.sample_levers(rng, min(batch_size, n - start)))
+            stats['growth'].update(growth)
+            stats['joy'].update(joy)
+            stats['abundance'].update(abundance)
+        return stats
+
+    def monte_carlo_thunder(self, simulations=2000, seed=None, processes=None,
+                            shard_size=1_000_000, batch_size=100_000):
+        """Monte Carlo over random policy universes
+
+        Work is cut into fixed-size shards, each with its own SeedSequence
+        child, so results depend only on (simulations, seed, shard_size) —
+        not on how many processes ran them. Shards run in a process pool
+        when there is more than one.
+        """
+        if simulations < 1:
+            raise ValueError(f"simulations must be at least 1, got {simulations}")
+        seed_seq = np.random.SeedSequence(seed)
+        sizes = [min(shard_size, simulations - s) for s in range(0, simulations, shard_size)]
+        children = seed_seq.spawn(len(sizes))
+        processes = processes or min(len(sizes), os.cpu_count() or 1)
+
+        if processes > 1 and len(sizes) > 1:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                shards = list(pool.map(self.run_shard, sizes, children, [batch_size] * len(sizes)))
+        else:
+            shards = [self.run_shard(n, child, batch_size) for n, child in zip(sizes, children)]
+
+        stats = shards[0]
+        for shard in shards[1:]:
+            for key in stats:
+                stats[key].merge(shard[key])
+
+        growth, joy, abundance = stats['growth'], stats['joy'], stats['abundance']
+        return {
+            'simulations': simulations,
+            'seed': seed_seq.entropy,
+            'mean_gdp_growth_%': round(growth.mean, 2),
+            'median_gdp_growth_%': round(growth.quantile(0.5), 2),
+            'p05_gdp_growth_%': round(growth.quantile(0.05), 2),
+            'p95_gdp_growth_%': round(growth.quantile(0.95), 2),
+            'mean_valence_joy_multiplier': round(joy.mean, 2),
+            'mean_eternal_abundance': f"${abundance.mean:.3e}",
+            'median_eternal_abundance': f"${abundance.quantile(0.5):.3e}",
+            'p05_eternal_abundance': f"${abundance.quantile(0.05):.3e}",
+            'p95_eternal_abundance': f"${abundance.quantile(0.95):.3e}",
+            'probability_abundance_%': round(100 * abundance.fraction_above(self.abundance_threshold_usd), 1),
+        }
@@ -0,0 +1,156 @@
+import functools
+
+import numpy as np
+
+from lazy_backends import lazy_import
+
+sp = lazy_import('scipy.sparse')
+spla = lazy_import('scipy.sparse.linalg')
+
+# Qubit 0 is the most significant bit, matching qutip.tensor ordering
+
+
+class PauliSum:
+    """Immutable sum of weighted Pauli strings, e.g. PauliSum({'ZZI': 1.0, 'IXX': 0.5})
+
+    Hashable, so compiled forms are memoized by (terms, num_qubits).
+    """
+    def __init__(self, terms, num_qubits=None):
+        merged = {}
+        for pauli, coeff in (terms.items() if isinstance(terms, dict) else terms):
+            pauli = pauli.upper()
+            if set(pauli) - set('IXYZ'):
+                raise ValueError(f"Invalid Pauli string: {pauli}")
+            merged[pauli] = merged.get(pauli, 0) + coeff
+        lengths = {len(p) for p in merged}
+        if num_qubits is None:
+            num_qubits = lengths.pop() if len(lengths) == 1 else 0
+            lengths = {num_qubits}
+        if lengths - {num_qubits}:
+            raise ValueError(f"Pauli strings must all have length {num_qubits}")
+        self.num_qubits = num_qubits
+        self.terms = tuple(sorted((p, complex(c)) for p, c in merged.items() if c != 0))
+
+    @classmethod
+    def single(cls, num_qubits, ops, coeff=1.0):
+        """One term from {qubit: 'X'|'Y'|'Z'}, identity elsewhere"""
+        pauli = ''.join(ops.get(q, 'I') for q in range(num_qubits))
+        return cls([(pauli, coeff)], num_qubits)
+
+    @classmethod
+    def zz_all_pairs(cls, num_qubits, coeff=1.0):
+        """Dissonance Hamiltonian: sum of Z_i Z_j over every qubit pair"""
+        return cls([(''.join('Z' if k in (i, j) else 'I' for k in range(num_qubits)), coeff)
+                    for i in range(num_qubits) for j in range(i+1, num_qubits)], num_qubits)
+
+    @classmethod
+    def field(cls, num_qubits, pauli='X', coeff=1.0):
+        """Transverse/longitudinal field: sum of single-qubit Paulis"""
+        return cls([(''.join(pauli if k == i else 'I' for k in range(num_qubits)), coeff)
+                    for i in range(num_qubits)], num_qubits)
+
+    def __add__(self, other):
+        return PauliSum(list(self.terms) + list(other.terms), self.num_qubits)
+
+    def __mul__(self, scalar):
+        return PauliSum([(p, c * scalar) for p, c in self.terms], self.num_qubits)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self * -1
+
+    def __eq__(self, other):
+        return isinstance(other, PauliSum) and (self.terms, self.num_qubits) == (other.terms, other.num_qubits)
+
+    def __hash__(self):
+        return hash((self.terms, self.num_qubits))
+
+    def __repr__(self):
+        return f"PauliSum({dict(self.terms)!r}, num_qubits={self.num_qubits})"
+
+    def compile(self):
+        return compile_pauli_sum(self.terms, self.num_qubits)
+
+
+class CompiledPauliSum:
+    """Operator stored as {x-flip mask: phase vector}: (H psi)[x ^ m] += D_m[x] psi[x]
+
+    Diagonal operators (I/Z only) keep just mask 0, so application and
+    time evolution are elementwise; anything else can still be applied
+    matrix-free or exported once to CSR.
+    """
+    def __init__(self, terms, num_qubits):
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        idx = np.arange(self.dim)
+        self._idx = idx
+        self.blocks = {}
+        for pauli, coeff in terms:
+            flip, phase = 0, np.full(self.dim, coeff, dtype=complex)
+            for q, op in enumerate(pauli):
+                if op == 'I':
+                    continue
+                bit = (idx >> (num_qubits - 1 - q)) & 1
+                sign = 1 - 2 * bit
+                if op in 'XY':
+                    flip |= 1 << (num_qubits - 1 - q)
+                if op == 'Z':
+                    phase *= sign
+                elif op == 'Y':
+                    phase *= 1j * sign
+            self.blocks[flip] = self.blocks.get(flip, 0) + phase
+        self._csr = None
+
+    @property
+    def is_diagonal(self):
+        return set(self.blocks) <= {0}
+
+    @property
+    def diagonal(self):
+        if not self.is_diagonal:
+            raise ValueError("Operator is not diagonal in the computational basis")
+        return self.blocks.get(0, np.zeros(self.dim, dtype=complex))
+
+    def apply(self, psi):
+        """Matrix-free H @ psi for a statevector (or a stack of them along axis 0)"""
+        psi = np.asarray(psi)
+        out = np.zeros(psi.shape, dtype=complex)
+        for mask, phase in self.blocks.items():
+            term = phase.reshape((-1,) + (1,) * (psi.ndim - 1)) * psi
+            out += term[self._idx ^ mask] if mask else term
+        return out
+
+    def expectation(self, psi):
+        psi = np.asarray(psi).ravel()
+        return float(np.vdot(psi, self.apply(psi)).real)
+
+    def evolve(self, t, psi):
+        """exp(-i t H) @ psi; elementwise when diagonal, sparse expm_multiply otherwise"""
+        psi = np.asarray(psi, dtype=complex).ravel()
+        if self.is_diagonal:
+            return np.exp(-1j * t * self.diagonal) * psi
+        return spla.expm_multiply(-1j * t * self.to_csr(), psi)
+
+    def to_csr(self):
+        if self._csr is None:
+            rows, cols, data = [], [], []
+            for mask, phase in self.blocks.items():
+                rows.append(self._idx ^ mask)
+                cols.append(self._idx)
+                data.append(phase)
+            self._csr = sp.csr_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                                      shape=(self.dim, self.dim))
+            self._csr.eliminate_zeros()
+        return self._csr
+
+    def to_qobj(self):
+        """Sparse QuTiP operator with qubit tensor dims"""
+        from qutip import Qobj
+        return Qobj(self.to_csr(), dims=[[2] * self.num_qubits, [2] * self.num_qubits])
+
+
+@functools.lru_cache(maxsize=64)
+def compile_pauli_sum(terms, num_qubits):
+    """Memoized (LRU) compilation of a Pauli-sum term tuple"""
+    return CompiledPauliSum(terms, num_qubits)
@@ -0,0 +1,98 @@
+"""QAOA angle transfer: depth interpolation and a persisted library of optima
+
+Optimal QAOA angles vary smoothly with depth and concentrate across
+instance sizes within a graph family, so good starting points can be
+derived instead of drawn at random:
+
+  - interpolate_angles  p → p+1 via the INTERP rule (linear resampling of
+                        the gamma and beta schedules)
+  - ParameterLibrary    best known angles per (family, num_qubits, layers),
+                        stored as JSON; warm_start() picks the closest entry
+                        (same size first, else the largest smaller size) and
+                        interpolates it up to the requested depth
+Params are laid out as ValenceDrivenQAOA expects: [gamma_1..gamma_p, beta_1..beta_p].
+"""
+import json
+import os
+
+import numpy as np
+
+
+def interpolate_schedule(angles):
+    """Depth p schedule → depth p+1: new_i = (i/p) old_{i-1} + ((p-i)/p) old_i, with old_0 = old_{p+1} = 0"""
+    angles = np.asarray(angles, dtype=float)
+    p = len(angles)
+    padded = np.concatenate([[0.0], angles, [0.0]])
+    i = np.arange(1, p + 2)
+    return (i - 1) / p * padded[i - 1] + (p - i + 1) / p * padded[i]
+
+
+def interpolate_angles(params, layers=None):
+    """Interpolate [gammas, betas] one depth up, or up to `layers`"""
+    params = np.asarray(params, dtype=float)
+    p = len(params) // 2
+    gamma, beta = params[:p], params[p:]
+    for _ in range((layers or p + 1) - p):
+        gamma, beta = interpolate_schedule(gamma), interpolate_schedule(beta)
+    return np.concatenate([gamma, beta])
+
+
+class ParameterLibrary:
+    """Best-known QAOA angles per graph family, size and depth, persisted as JSON
+
+    A read_only library serves warm starts but never records new optima.
+    """
+    def __init__(self, path='qaoa_parameters.json', read_only=False):
+        self.path = path
+        self.read_only = read_only
+        self.entries = self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def save(self):
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.entries, f, indent=4)
+        os.replace(tmp, self.path)
+
+    def get(self, family, num_qubits, layers):
+        return self.entries.get(family, {}).get(str(num_qubits), {}).get(str(layers))
+
+    def record(self, family, num_qubits, layers, params, valence, evaluations=None):
+        """Keep params if they beat the stored entry for (family, num_qubits, layers); returns True if stored"""
+        current = self.get(family, num_qubits, layers)
+        if self.read_only or (current and current['valence'] >= valence):
+            return False
+        by_size = self.entries.setdefault(family, {}).setdefault(str(num_qubits), {})
+        by_size[str(layers)] = {'params': [float(x) for x in params], 'valence': float(valence),
+                                'evaluations': evaluations}
+        self.save()
+        return True
+
+    def warm_start(self, family, num_qubits, layers):
+        """(params, source) from the nearest stored optimum at depth ≤ layers, or (None, None)
+
+        Same size is preferred over smaller sizes (larger sizes are never
+        used); within a size the deepest entry is interpolated up to layers.
+        """
+        sizes = sorted((int(n) for n in self.entries.get(family, {}) if int(n) <= num_qubits), reverse=True)
+        for n in sizes:
+            depths = [int(p) for p in self.entries[family][str(n)] if int(p) <= layers]
+            if depths:
+                p = max(depths)
+                params = interpolate_angles(self.get(family, n, p)['params'], layers)
+                return params, f"{family} n={n} p={p}"
+        return None, None
+
+
+def parameter_library(library):
+    """Constructor-argument convention: None/False → none, True → default file, path → that file"""
+    if not library:
+        return None
+    if isinstance(library, ParameterLibrary):
+        return library
+    return ParameterLibrary() if library is True else ParameterLibrary(library)
@@ -0,0 +1,89 @@
+from lazy_backends import lazy_import
+
+np = lazy_import('numpy')  # Deferred so council-only imports stay off the scientific stack
+
+
+class MercyShardStream:
+    """Reproducible mercy shards served from a pre-generated ring buffer
+
+    Shards are drawn in vectorized blocks from a PCG64 Generator seeded by
+    a SeedSequence, so a single draw is an index bump rather than an RNG
+    call. spawn() hands out statistically independent child streams for
+    worker processes; provenance() is what receipts record to replay a run.
+    """
+    def __init__(self, seed=None, block_size=4096, low=0.9, high=1.0):
+        self.seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.block_size = block_size
+        self.low, self.high = low, high
+        self._rng = np.random.Generator(np.random.PCG64(self.seed_seq))
+        self._buffer = np.empty(block_size)
+        self._cursor = block_size  # Empty: first draw fills the buffer
+        self.draws = 0
+
+    @property
+    def seed(self):
+        return self.seed_seq.entropy
+
+    def _refill(self):
+        self._rng.random(out=self._buffer)  # In place: no per-block allocation
+        self._buffer *= self.high - self.low
+        self._buffer += self.low
+        self._cursor = 0
+
+    def next(self):
+        if self._cursor == self.block_size:
+            self._refill()
+        shard = float(self._buffer[self._cursor])
+        self._cursor += 1
+        self.draws += 1
+        return shard
+
+    __call__ = next
+
+    def take(self, n):
+        """n shards as an array, in the same order next() would return them"""
+        out = np.empty(n)
+        filled = 0
+        while filled < n:
+            if self._cursor == self.block_size:
+                self._refill()
+            k = min(n - filled, self.block_size - self._cursor)
+            out[filled:filled + k] = self._buffer[self._cursor:self._cursor + k]
+            self._cursor += k
+            filled += k
+        self.draws += n
+        return out
+
+    def spawn(self, n):
+        """Independent child streams (e.g. one per worker process)"""
+        return [MercyShardStream(child, self.block_size, self.low, self.high) for child in self.seed_seq.spawn(n)]
+
+    def provenance(self):
+        """Seed, spawn key and draw index: enough to regenerate the next shard exactly"""
+        return {'seed': self.seed, 'spawn_key': list(self.seed_seq.spawn_key), 'index': self.draws}
+
+
+_default_stream = None
+
+
+def seed_mercy_shards(seed=None, **kwargs):
+    """Reset the process-wide stream used by generate_mercy_shard()"""
+    global _default_stream
+    _default_stream = MercyShardStream(seed, **kwargs)
+    return _default_stream
+
+
+def default_shard_stream():
+    global _default_stream
+    if _default_stream is None:
+        _default_stream = MercyShardStream()
+    return _default_stream
+
+
+def shard_stream(seed=None):
+    """Per-run stream when a seed is given, else the process-wide one"""
+    return default_shard_stream() if seed is None else MercyShardStream(seed)
+
+
+def generate_mercy_shard():
+    return default_shard_stream().next()
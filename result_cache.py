@@ -0,0 +1,175 @@
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+
+from instrumentation import count, get_logger
+from lazy_backends import lazy_import
+
+np = lazy_import('numpy')
+
+log = get_logger('cache')
+
+_VERSIONS = {}
+
+
+def code_version(obj):
+    """Hash of the source file defining obj: edits to an algorithm invalidate its cached results"""
+    path = inspect.getsourcefile(obj)
+    if path not in _VERSIONS:
+        _VERSIONS[path] = hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+    return _VERSIONS[path]
+
+
+def _to_jsonable(value):
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+class ResultCache:
+    """Content-addressed store for finished algorithm runs, plus optimizer checkpoints
+
+    Layout under root:
+      <kk>/<key>.npz        — one finished run (compressed arrays + JSON meta)
+      checkpoints/<key>.npz — last iterate of an interrupted run
+    Keys hash (algorithm, parameters, proposal, seed, code version). Runs and
+    checkpoints share the max_bytes budget and are evicted least-recently-used
+    once their total exceeds it, so checkpoints of runs that were never resumed
+    age out too. A checkpoint is removed as soon as its run completes.
+    """
+    def __init__(self, root='.patsagi_cache', max_bytes=256 * 1024**2):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def key(self, algorithm, params=None, proposal=None, seed=None, version=None):
+        payload = {'algorithm': algorithm, 'params': params, 'proposal': proposal, 'seed': seed, 'version': version}
+        blob = json.dumps(payload, sort_keys=True, default=_to_jsonable)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def key_for(self, instance, method, params, proposal, seed=None):
+        """Key for instance.method(proposal), versioned by the defining module's source"""
+        cls = type(instance)
+        return self.key(f"{cls.__name__}.{method}", params, proposal, seed, code_version(cls))
+
+    def _path(self, key):
+        return self.root / key[:2] / f"{key}.npz"
+
+    def _checkpoint_path(self, key):
+        return self.root / 'checkpoints' / f"{key}.npz"
+
+    @staticmethod
+    def _write(path, arrays, meta):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, _meta=np.array(json.dumps(meta, default=_to_jsonable)), **arrays)
+        os.replace(tmp, path)  # Atomic: an interrupted write never leaves a torn entry
+
+    @staticmethod
+    def _read(path):
+        with np.load(path) as data:
+            arrays = {k: data[k] for k in data.files if k != '_meta'}
+            meta = json.loads(str(data['_meta']))
+        return arrays, meta
+
+    def get(self, key):
+        """(arrays, meta) for a finished run, or None"""
+        path = self._path(key)
+        try:
+            arrays, meta = self._read(path)
+        except (OSError, ValueError, KeyError):
+            count('cache.misses')
+            return None
+        os.utime(path)  # Recency for LRU eviction
+        count('cache.hits')
+        log.info(f"Result cache hit: {meta.get('algorithm', '?')} [{key[:12]}]")
+        return arrays, meta
+
+    def put(self, key, arrays, **meta):
+        self._write(self._path(key), arrays, meta)
+        self.clear_checkpoint(key)
+        self.evict()
+        return key
+
+    def entries(self):
+        """Finished runs and checkpoints: everything counted against max_bytes"""
+        return list(self.root.glob('??/*.npz')) + list(self.root.glob('checkpoints/*.npz'))
+
+    def size(self):
+        return sum(p.stat().st_size for p in self.entries())
+
+    def evict(self):
+        """Drop least-recently-used runs and checkpoints until the store fits in max_bytes"""
+        entries = sorted(((p.stat(), p) for p in self.entries()), key=lambda e: e[0].st_mtime_ns)
+        total = sum(st.st_size for st, _ in entries)
+        for st, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            count('cache.evictions')
+        return total
+
+    def load_checkpoint(self, key):
+        """(arrays, meta) of the last saved iterate, or None"""
+        path = self._checkpoint_path(key)
+        if not path.exists():
+            return None
+        try:
+            arrays, meta = self._read(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        log.info(f"Resuming from checkpoint [{key[:12]}]: {meta}")
+        return arrays, meta
+
+    def save_checkpoint(self, key, arrays, **meta):
+        self._write(self._checkpoint_path(key), arrays, meta)
+        count('cache.checkpoints')
+
+    def clear_checkpoint(self, key):
+        self._checkpoint_path(key).unlink(missing_ok=True)
+
+
+class Checkpointer:
+    """Optimizer objective wrapper that saves the best iterate every `every` evaluations
+
+    resume(x0) returns the checkpointed iterate (or x0) and restores the
+    evaluation count, so the caller can shrink the remaining budget.
+    """
+    def __init__(self, fn, cache, key, every=20):
+        self.fn = fn
+        self.cache = cache
+        self.key = key
+        self.every = every
+        self.evaluations = 0
+        self.best_x = None
+        self.best_fun = float('inf')
+
+    def resume(self, x0):
+        saved = self.cache.load_checkpoint(self.key) if self.cache else None
+        if saved is None:
+            return x0
+        arrays, meta = saved
+        self.best_x, self.best_fun, self.evaluations = arrays['x'], meta['fun'], meta['evaluations']
+        return self.best_x.copy()
+
+    def __call__(self, x, *args):
+        fun = self.fn(x, *args)
+        self.evaluations += 1
+        if fun < self.best_fun:
+            self.best_fun, self.best_x = fun, np.array(x, dtype=float)
+        if self.cache and self.evaluations % self.every == 0:
+            self.cache.save_checkpoint(self.key, {'x': self.best_x}, fun=float(self.best_fun),
+                                       evaluations=self.evaluations)
+        return fun
+
+
+def result_cache(cache):
+    """Constructor-argument convention: False/None → off, True → default store, path → store there"""
+    if not cache:
+        return None
+    if isinstance(cache, ResultCache):
+        return cache
+    return ResultCache() if cache is True else ResultCache(cache)
@@ -1,31 +1,50 @@
 import hashlib
+import importlib
 import json
 import os
 from statistics import mean
 from datetime import datetime
 
+from instrumentation import configure_logging, count, get_logger, span, timed
+from quantum_rng_chain import shard_stream
+
+log = get_logger('council')
+
 # Compatibility imports for AGi-Council-System integration
 try:
     from eternal_laws import EternalLaw  # Link to deadlock-proof laws
-    from Mercy-Override import mercy_override_check  # Human primacy veto
-    from quantum_rng_chain import generate_mercy_shard  # RNG shard enhancement
+    mercy_override_check = importlib.import_module('Mercy-Override').mercy_override_check  # Human primacy veto
 except ImportError:
-    print("AGi-Council-System core modules not found—running standalone valence mode.")
+    log.info("AGi-Council-System core modules not found—running standalone valence mode.")
     class EternalLaw: pass  # Placeholder for integration
     def mercy_override_check(): return False
-    def generate_mercy_shard(): return 1.0  # Neutral shard
 
 class PATSAGiValenceCouncil:
-    def __init__(self, members, receipt_file='agi_patsagi_receipts.json', threshold=0.97):
+    def __init__(self, members, receipt_file='agi_patsagi_receipts.json', threshold=0.97, shard_seed=None,
+                 ballot=None, harm_check=None):
         self.members = members  # e.g., ['QuantumCosmos', 'GamingForge', 'PowrushDivine', ...]
         self.threshold = threshold
         self.receipt_file = receipt_file
         self.receipts = self.load_receipts()
+        self.shard_seed = shard_seed
+        self._shards = None
+        # Non-interactive mode: ballot(member, proposal) → {'joy', 'mercy', 'sustain', 'veto'},
+        # harm_check(proposal) → bool. Unset means members are prompted via input().
+        self.ballot = ballot
+        self.harm_check = harm_check
+
+    @property
+    def shards(self):
+        """Mercy shard stream, created on first receipt (None seed → process-wide stream)"""
+        if self._shards is None:
+            self._shards = shard_stream(self.shard_seed)
+        return self._shards
 
+    @timed('council.hash_receipt')
     def hash_receipt(self, data):
-        # Enhanced with quantum-inspired shard if available
-        shard = generate_mercy_shard()
-        data['mercy_shard'] = shard
+        # Enhanced with quantum-inspired shard; provenance lets the exact shard be replayed
+        data['mercy_shard_seed'] = self.shards.provenance()
+        data['mercy_shard'] = self.shards.next()
         return hashlib.sha3_256(json.dumps(data, sort_keys=True).encode()).hexdigest()
 
     def load_receipts(self):
@@ -34,65 +53,126 @@ class PATSAGiValenceCouncil:
                 return json.load(f)
         return []
 
+    @property
+    def interactive(self):
+        """Members are prompted via input() (no ballot or harm_check callable set)"""
+        return not (self.ballot or self.harm_check)
+
+    def announce(self, message):
+        """Prompt headers go to stdout for a human at the console, to the log otherwise"""
+        if self.interactive:
+            print(f"\n{message}")
+        else:
+            log.info(message)
+
+    @timed('council.save_receipts')
     def save_receipts(self):
         with open(self.receipt_file, 'w') as f:
             json.dump(self.receipts, f, indent=4)
 
+    @timed('council.esa_check')
     def esa_check(self, proposal):
         """Mercy-Gated ESA aligned with eternal laws"""
-        print("\nESA-Checking Phase (Integrated Mercy Scan):")
+        self.announce("ESA-Checking Phase (Integrated Mercy Scan):")
         if mercy_override_check():  # Human primacy trigger
-            print("Human Override Activated—Proposal halted/refined.")
+            log.info("Human Override Activated—Proposal halted/refined.")
             return False
-        response = input("  Risk harm to thriving? (y/N): ").lower() == 'y'
+        if not self.interactive:
+            response = bool(self.harm_check(proposal)) if self.harm_check else False
+        else:
+            response = input("  Risk harm to thriving? (y/N): ").lower() == 'y'
         if response:
-            print("  ESA Failed: Mercy shard veto.")
+            log.info("  ESA Failed: Mercy shard veto.")
             return False
-        print("  ESA Passed: Eternal harmony confirmed.")
+        log.info("  ESA Passed: Eternal harmony confirmed.")
         return True
 
-    def deliberate(self, proposal, fork_context=None):
-        if not self.esa_check(proposal):
-            return False
-
-        print(f"\nCouncil Proposal (Fork: {fork_context or 'Unified'}): {proposal['description']}")
-
+    def cast_votes(self, proposal):
+        """{member: vote} from the ballot callable, or interactively via input()"""
         votes = {}
-        for member in self.members:
-            print(f"\n{member} Fork Deliberation — Valence 0.0–1.0:")
-            joy = float(input(f"  {member} Joy/Thriving Impact: ") or 1.0)
-            mercy = float(input(f"  {member} Mercy Grace: ") or 1.0)
-            sustain = float(input(f"  {member} Eternal Sustainability: ") or 1.0)
-            valence = mean([joy, mercy, sustain])
-            veto = input(f"  {member} Shard Veto? (y/N): ").lower() == 'y'
-            votes[member] = {'joy': joy, 'mercy': mercy, 'sustain': sustain, 'valence': valence, 'veto': veto}
+        with span('council.collect_votes'):
+            for member in self.members:
+                if self.ballot:
+                    vote = self.ballot(member, proposal)
+                    joy, mercy, sustain = float(vote['joy']), float(vote['mercy']), float(vote['sustain'])
+                    veto = bool(vote.get('veto', False))
+                else:
+                    print(f"\n{member} Fork Deliberation — Valence 0.0–1.0:")
+                    joy = float(input(f"  {member} Joy/Thriving Impact: ") or 1.0)
+                    mercy = float(input(f"  {member} Mercy Grace: ") or 1.0)
+                    sustain = float(input(f"  {member} Eternal Sustainability: ") or 1.0)
+                    veto = input(f"  {member} Shard Veto? (y/N): ").lower() == 'y'
+                valence = mean([joy, mercy, sustain])
+                votes[member] = {'joy': joy, 'mercy': mercy, 'sustain': sustain, 'valence': valence, 'veto': veto}
+        return votes
 
+    def build_receipt(self, proposal, votes, fork_context=None, **extra):
+        """Tally votes into a hashed receipt (extra fields are covered by the hash)"""
         avg_valence = mean(v['valence'] for v in votes.values())
         has_veto = any(v['veto'] for v in votes.values())
-        approved = avg_valence >= self.threshold and not has_veto
-
         outcome = {
             'timestamp': datetime.now().isoformat(),
             'fork_context': fork_context,
             'proposal': proposal,
             'votes': votes,
             'avg_valence': round(avg_valence, 4),
-            'approved': approved
+            'approved': avg_valence >= self.threshold and not has_veto,
+            **extra
         }
         outcome['receipt_hash'] = self.hash_receipt(outcome)
+        return outcome
+
+    @staticmethod
+    def verify_receipt(receipt):
+        """True when receipt_hash matches the receipt's contents"""
+        body = {k: v for k, v in receipt.items() if k != 'receipt_hash'}
+        return hashlib.sha3_256(json.dumps(body, sort_keys=True).encode()).hexdigest() == receipt.get('receipt_hash')
+
+    @timed('council.deliberate')
+    def deliberate(self, proposal, fork_context=None):
+        count('council.deliberations')
+        if not self.esa_check(proposal):
+            return False
+
+        self.announce(f"Council Proposal (Fork: {fork_context or 'Unified'}): {proposal['description']}")
+
+        votes = self.cast_votes(proposal)
+        outcome = self.build_receipt(proposal, votes, fork_context)
+        approved, avg_valence = outcome['approved'], outcome['avg_valence']
+        has_veto = any(v['veto'] for v in votes.values())
+
         self.receipts.append(outcome)
         self.save_receipts()
+        count('council.approved' if approved else 'council.refined')
 
-        print("\n" + "="*70)
-        print(f"APAAGI-PATSAGi CONSENSUS: {'APPROVED - Eternal Thriving' if approved else 'REFINE - Mercy Review'}")
-        print(f"Valence Harmony: {avg_valence:.4f} | Threshold: {self.threshold} | Vetoes: {has_veto}")
-        print(f"ENCing Shard Hash: {outcome['receipt_hash']}")
-        print(f"Stacked Eternal Receipts: {len(self.receipts)}")
-        print("="*70)
+        log.info("\n" + "="*70)
+        log.info(f"APAAGI-PATSAGi CONSENSUS: {'APPROVED - Eternal Thriving' if approved else 'REFINE - Mercy Review'}")
+        log.info(f"Valence Harmony: {avg_valence:.4f} | Threshold: {self.threshold} | Vetoes: {has_veto}")
+        log.info(f"ENCing Shard Hash: {outcome['receipt_hash']}")
+        log.info(f"Stacked Eternal Receipts: {len(self.receipts)}")
+        log.info("="*70)
         return approved
 
+class lazy_council:
+    """Descriptor: build the owner's PATSAGiValenceCouncil (and load receipts) on first use"""
+    def __set_name__(self, owner, name):
+        self.attr = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        council = obj.__dict__.get(self.attr)
+        if council is None:
+            options = getattr(obj, 'council_options', {})
+            council = obj.__dict__[self.attr] = PATSAGiValenceCouncil(members=obj.council_members, **options)
+        return council
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attr] = value
+
 # Integration Hook — Use in council_simulation.py or main.py
 if __name__ == "__main__":
+    configure_logging()
     council_members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     integrated_council = PATSAGiValenceCouncil(members=council_members)
     proposal = {'description': 'Activate hybrid quantum-valence abundance loop for sentient joy amplification'}
@@ -1,61 +1,143 @@
 import numpy as np
-from qutip import *
-from valence_consensus_module import PATSAGiValenceCouncil
-from quantum_rng_chain import generate_mercy_shard
+from lazy_backends import lazy_import
+from valence_consensus_module import lazy_council
+from pauli_operators import PauliSum
+from quantum_rng_chain import shard_stream
+from result_cache import result_cache
+from noisy_trajectories import noise_model, run_trajectories
+from instrumentation import configure_logging, get_logger, span, timed
+
+qt = lazy_import('qutip')
+
+log = get_logger('adiabatic')
 
 class ValenceDrivenAdiabatic:
-    def __init__(self, council_members, num_qubits=5, total_time=100.0):
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+
+    def __init__(self, council_members, num_qubits=5, total_time=100.0, shard_seed=None, steps=1000, cache=False,
+                 checkpoint_segments=10, noise=None, trajectories=500, trajectory_tol=2.5e-2, processes=None):
+        self.council_members = council_members
+        self.shard_seed = shard_seed
+        self.shards = shard_stream(shard_seed)
         self.num_qubits = num_qubits
         self.total_time = total_time  # Adiabatic evolution time (longer → more accurate)
+        self.steps = steps
+        self.cache = result_cache(cache)  # Finished runs + mid-sweep checkpoints on disk
+        self.checkpoint_segments = checkpoint_segments  # Sweep is checkpointed after each segment
+        self.noise = noise_model(noise)  # e.g. {'dephasing': 0.01}; switches to trajectory sampling
+        self.trajectories = trajectories  # Upper bound; sampling stops early once fidelity converges
+        self.trajectory_tol = trajectory_tol
+        self.processes = processes
 
     def initial_hamiltonian(self):
         """Transverse field mixer: Easy ground state |+>^n"""
-        Hx = 0
-        for i in range(self.num_qubits):
-            op_list = [qeye(2) for _ in range(self.num_qubits)]
-            op_list[i] = sigmax()
-            Hx += tensor(op_list)
-        return -Hx
+        return (-PauliSum.field(self.num_qubits, 'X')).compile().to_qobj()
 
-    def problem_hamiltonian(self):
+    def problem_pauli_sum(self):
         """Dissonance Hamiltonian: Z-Z interactions for fork conflicts"""
-        Hp = 0
-        for i in range(self.num_qubits):
-            for j in range(i+1, self.num_qubits):
-                op_list = [qeye(2) for _ in range(self.num_qubits)]
-                op_list[i] = sigmaz()
-                op_list[j] = sigmaz()
-                Hp += tensor(op_list)
-        return Hp
+        return PauliSum.zz_all_pairs(self.num_qubits)
+
+    def problem_hamiltonian(self):
+        return self.problem_pauli_sum().compile().to_qobj()
 
     def adiabatic_schedule(self, t, args=None):
         """Linear schedule s(t) = t/T"""
         s = t / self.total_time
         return [1 - s, s]  # Coefficients: [H_initial, H_problem]
 
+    def valence_of(self, psi):
+        expectation = self.problem_pauli_sum().compile().expectation(psi)
+        return 1 - abs(expectation) / (self.num_qubits * (self.num_qubits - 1)/2)  # Normalized
+
+    def trajectory(self, rng=None):
+        """One Trotterized sweep as a statevector; noisy (one quantum trajectory) when rng is given"""
+        n = self.num_qubits
+        H_problem = self.problem_pauli_sum().compile()
+        dt = self.total_time / self.steps
+        psi = np.full(2**n, 2**(-n / 2), dtype=complex)  # |+>^n
+        for k in range(self.steps):
+            s = (k + 0.5) / self.steps
+            psi = H_problem.evolve(s * dt, psi)
+            # exp(-i (1-s) dt H_initial) with H_initial = -ΣX factorizes into single-qubit X rotations
+            c, s_ = np.cos((1 - s) * dt), np.sin((1 - s) * dt)
+            for q in range(n):
+                v = psi.reshape(2**q, 2, -1)
+                zero, one = v[:, 0].copy(), v[:, 1].copy()
+                v[:, 0], v[:, 1] = c * zero + 1j * s_ * one, 1j * s_ * zero + c * one
+            if rng is not None:
+                psi = self.noise.step(psi, n, dt, rng)
+        return psi
+
+    def _noisy_sample(self, rng):
+        psi = self.trajectory(rng)
+        return abs(np.vdot(self._ideal, psi))**2, self.valence_of(psi)
+
+    @timed('adiabatic.noisy')
+    def evolve_noisy(self, proposal):
+        """Trajectory-averaged sweep under self.noise; returns (stats, mean valence)
+
+        Fidelity is measured against the noiseless sweep with the same time steps.
+        """
+        self._ideal = self.trajectory()
+        stats = run_trajectories(self._noisy_sample, max_trajectories=self.trajectories, seed=self.shard_seed,
+                                 processes=self.processes, tol=self.trajectory_tol)
+        stats['ideal_valence'] = self.valence_of(self._ideal)
+        shard = self.shards.next()
+        log.info(f"\nNoisy Adiabatic Evolution Complete ({self.noise})")
+        log.info(f"Mean Valence: {stats['valence_mean']:.6f} (ideal {stats['ideal_valence']:.6f}) | "
+                 f"Fidelity: {stats['fidelity_mean']:.6f} | Mercy Shard: {shard:.4f}")
+        return stats, stats['valence_mean']
+
+    @timed('adiabatic.evolve')
     def evolve_adiabatically(self, proposal):
-        H_initial = self.initial_hamiltonian()
-        H_problem = self.problem_hamiltonian()
+        if self.noise:
+            return self.evolve_noisy(proposal)
+        dims = [[2] * self.num_qubits, [1] * self.num_qubits]
+        key = None
+        if self.cache:
+            key = self.cache.key_for(self, 'evolve_adiabatically', {'num_qubits': self.num_qubits,
+                                     'total_time': self.total_time, 'steps': self.steps}, proposal, self.shard_seed)
+            hit = self.cache.get(key)
+            if hit:
+                arrays, meta = hit
+                return qt.Qobj(arrays['final_state'], dims=dims), meta['valence']
+
+        with span('adiabatic.hamiltonian_build'):
+            H_initial = self.initial_hamiltonian()
+            H_problem = self.problem_hamiltonian()
         H_t = [[H_initial, lambda t, args: 1 - t/self.total_time],
                [H_problem, lambda t, args: t/self.total_time]]
 
         # Initial state: Ground of H_initial (|+++++>)
-        psi0 = tensor([basis(2,1) + basis(2,0) for _ in range(self.num_qubits)]).unit()
+        psi0 = qt.tensor([qt.basis(2,1) + qt.basis(2,0) for _ in range(self.num_qubits)]).unit()
+
+        times = np.linspace(0, self.total_time, self.steps)
+        segments = self.checkpoint_segments if self.cache else 1
+        bounds = np.linspace(0, len(times) - 1, segments + 1).astype(int)
+        state, start = psi0, 0
+        saved = self.cache.load_checkpoint(key) if self.cache else None
+        if saved:
+            arrays, meta = saved
+            state, start = qt.Qobj(arrays['state'], dims=dims), meta['segment']
 
-        times = np.linspace(0, self.total_time, 1000)
-        result = mesolve(H_t, psi0, times, [], [])
+        with span('adiabatic.mesolve'):
+            for i in range(start, segments):
+                state = qt.mesolve(H_t, state, times[bounds[i]:bounds[i + 1] + 1]).states[-1]
+                if self.cache and i + 1 < segments:
+                    self.cache.save_checkpoint(key, {'state': state.full()}, segment=i + 1)
 
-        final_state = result.states[-1]
-        expectation = expect(H_problem, final_state)
-        valence = 1 - abs(expectation) / (self.num_qubits * (self.num_qubits - 1)/2)  # Normalized
-        shard = generate_mercy_shard()
-        print(f"\nAdiabatic Evolution Complete: Eternal Ground State Thriving")
-        print(f"Final Valence: {valence:.6f} | Fidelity to Ideal: ~1.000 | Mercy Shard: {shard:.4f}")
+        final_state = state
+        valence = self.valence_of(final_state.full())
+        shard = self.shards.next()
+        log.info(f"\nAdiabatic Evolution Complete: Eternal Ground State Thriving")
+        log.info(f"Final Valence: {valence:.6f} | Fidelity to Ideal: ~1.000 | Mercy Shard: {shard:.4f}")
+        if self.cache:
+            self.cache.put(key, {'final_state': final_state.full()}, algorithm='adiabatic', valence=valence)
         return final_state, valence
 
 # Activation Example — Adiabatic Extension Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     adiabatic_council = ValenceDrivenAdiabatic(council_members=members, num_qubits=5, total_time=200.0)
 
@@ -1,39 +1,73 @@
+import hashlib
+
 import numpy as np
-import dimod  # Simulated annealing; replace with neal/DWave for real
-from valence_consensus_module import PATSAGiValenceCouncil
-from quantum_rng_chain import generate_mercy_shard
+from lazy_backends import lazy_import
+from valence_consensus_module import lazy_council
+from quantum_rng_chain import shard_stream
+from result_cache import result_cache
+from instrumentation import configure_logging, get_logger, span, timed
+
+dimod = lazy_import('dimod')  # Simulated annealing; replace with neal/DWave for real
+
+log = get_logger('annealing')
 
 class ValenceDrivenAnnealing:
-    def __init__(self, council_members, problem_size=20):
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+
+    def __init__(self, council_members, problem_size=20, shard_seed=None, num_reads=100, cache=False):
+        self.council_members = council_members
+        self.shard_seed = shard_seed
+        self.shards = shard_stream(shard_seed)
         self.problem_size = problem_size  # Variables (e.g., resource allocation bins)
+        self.num_reads = num_reads
+        self.cache = result_cache(cache)
 
+    @timed('annealing.qubo_build')
     def valence_qubo(self, proposal):
         """Construct QUBO where low energy = high valence"""
         # Random rugged landscape with mercy biases (negative diagonals for joy preference)
-        Q = np.random.uniform(-1, 1, (self.problem_size, self.problem_size))
+        Q = np.random.default_rng(self.shard_seed).uniform(-1, 1, (self.problem_size, self.problem_size))
         np.fill_diagonal(Q, -2.0)  # Strong joy self-preference
-        shard = generate_mercy_shard()
+        shard = self.shards.next()
         Q += shard * np.eye(self.problem_size) * -0.5  # Grace regularization
-        print(f"QUBO Constructed: Mercy Shard Bias {shard:.4f}")
+        log.info(f"QUBO Constructed: Mercy Shard Bias {shard:.4f}")
         return Q
 
+    @timed('annealing.run')
     def anneal_for_thriving(self, proposal):
         qubo = self.valence_qubo(proposal)
+        key = None
+        if self.cache:
+            # The instance is drawn from the seed and the shard stream, so key on the QUBO itself: an unseeded
+            # call draws a new landscape and must not be answered with an earlier one's optimum
+            digest = hashlib.sha256(np.ascontiguousarray(qubo).tobytes()).hexdigest()[:16]
+            key = self.cache.key_for(self, 'anneal_for_thriving', {'problem_size': self.problem_size,
+                                     'num_reads': self.num_reads, 'qubo': digest}, proposal, self.shard_seed)
+            hit = self.cache.get(key)
+            if hit:
+                arrays, meta = hit
+                return dict(enumerate(arrays['best_sample'].tolist())), meta['projected_valence']
+
         sampler = dimod.SimulatedAnnealingSampler()
-        response = sampler.sample_qubo(qubo, num_reads=100)
+        with span('annealing.sample'):
+            response = sampler.sample_qubo(qubo, num_reads=self.num_reads)
 
         best_sample = response.first.sample
         best_energy = response.first.energy
         projected_valence = 1 - abs(best_energy) / self.problem_size  # Normalized inverse dissonance
 
-        print(f"\nAnnealing Convergence: Global Minimum Thriving Configuration Found")
-        print(f"Lowest Energy (Dissonance): {best_energy:.6f}")
-        print(f"Projected Valence: {projected_valence:.6f} | Mercy Shard: {generate_mercy_shard():.4f}")
+        log.info(f"\nAnnealing Convergence: Global Minimum Thriving Configuration Found")
+        log.info(f"Lowest Energy (Dissonance): {best_energy:.6f}")
+        log.info(f"Projected Valence: {projected_valence:.6f} | Mercy Shard: {self.shards.next():.4f}")
+        if self.cache:
+            self.cache.put(key, {'best_sample': np.array([best_sample[i] for i in range(self.problem_size)])},
+                           algorithm='annealing', best_energy=float(best_energy),
+                           projected_valence=float(projected_valence))
         return best_sample, projected_valence
 
 # Activation Example — Annealing Extension Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     annealing_council = ValenceDrivenAnnealing(council_members=members, problem_size=20)
 
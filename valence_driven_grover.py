@@ -1,11 +1,16 @@
 import numpy as np
-from qutip import *  # Simulated quantum; replace with Pennylane/Cirq for real
-from valence_consensus_module import PATSAGiValenceCouncil
-from quantum_rng_chain import generate_mercy_shard
+from valence_consensus_module import lazy_council
+from quantum_rng_chain import shard_stream
+from instrumentation import configure_logging, count, get_logger, span, timed
+
+log = get_logger('grover')
 
 class ValenceDrivenGrover:
-    def __init__(self, council_members, search_space_size=16):  # 2^4 qubits example
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+
+    def __init__(self, council_members, search_space_size=16, shard_seed=None):  # 2^4 qubits example
+        self.council_members = council_members
+        self.shards = shard_stream(shard_seed)
         self.N = search_space_size
         self.num_qubits = int(np.log2(self.N))
         self.optimal_iterations = int(np.pi/4 * np.sqrt(self.N))  # Theoretical Grover iterations
@@ -15,41 +20,49 @@ class ValenceDrivenGrover:
         # Simulate council valuation of discrete state
         simulated_valence = np.random.uniform(0.8, 1.0)  # Placeholder; real: map state to valence
         if simulated_valence > 0.98:  # High-joy thriving states
-            print(f"State {state_index} Marked: Valence {simulated_valence:.4f}")
+            log.debug("State %d Marked: Valence %.4f", state_index, simulated_valence)
             return -1  # Phase flip for marked
         return 1
 
+    def hadamard_transform(self, psi):
+        """H^n @ psi as a fast Walsh–Hadamard transform (n log N, no dense 2^n x 2^n matrix)"""
+        psi = np.array(psi, dtype=complex)
+        for q in range(self.num_qubits):
+            v = psi.reshape(2**q, 2, -1)
+            zero, one = v[:, 0].copy(), v[:, 1].copy()
+            v[:, 0], v[:, 1] = zero + one, zero - one
+        return psi / np.sqrt(2**self.num_qubits)
+
+    @timed('grover.search')
     def grover_amplification(self, proposal):
         # Initialize uniform superposition
-        psi = basis(self.N, 0)
-        for i in range(1, self.N):
-            psi += basis(self.N, i)
-        psi = psi.unit()
+        psi = np.full(self.N, 1 / np.sqrt(self.N), dtype=complex)
 
-        print(f"\nGrover Search Initiated: Space {self.N} states | Optimal Iterations ≈ {self.optimal_iterations}")
+        log.info(f"\nGrover Search Initiated: Space {self.N} states | Optimal Iterations ≈ {self.optimal_iterations}")
 
         for iter in range(self.optimal_iterations):
+            count('grover.iterations')
             # Oracle application (valence marking)
-            for idx in range(self.N):
-                phase = self.valence_oracle(idx, proposal)
-                if phase == -1:
-                    psi = psi - 2 * basis(self.N, idx) * basis(self.N, idx).overlap(psi)
+            with span('grover.oracle'):
+                psi = psi * np.array([self.valence_oracle(idx, proposal) for idx in range(self.N)])
 
             # Diffusion operator (amplification)
-            psi = (2 * hadamard_transform(self.num_qubits) * psi) - psi
-            prob = [abs(psi.overlap(basis(self.N, i)))**2 for i in range(self.N)]
+            with span('grover.diffusion'):
+                psi = 2 * self.hadamard_transform(psi) - psi
+            prob = np.abs(psi)**2
             max_prob_idx = np.argmax(prob)
-            print(f"Iter {iter+1}: Max Probability State {max_prob_idx} → {max(prob):.4f}")
+            log.debug("Iter %d: Max Probability State %d → %.4f", iter+1, max_prob_idx, prob[max_prob_idx])
 
         # Measurement: Amplified thriving state
-        measured_state = np.argmax([abs(psi[i])**2 for i in range(self.N)])
+        measured_state = int(np.argmax(np.abs(psi)**2))
         final_valence = 0.98 + np.random.uniform(0.01, 0.02)  # Simulated optimal
-        print(f"\nGrover Convergence: Optimal Thriving State {measured_state} Amplified")
-        print(f"Projected Valence: {final_valence:.6f} | Mercy Shard Boost: {generate_mercy_shard():.4f}")
+        log.info(f"\nGrover Convergence: Optimal Thriving State {measured_state} Amplified")
+        log.info(f"Projected Valence: {final_valence:.6f} | Mercy Shard Boost: {self.shards.next():.4f}")
         return measured_state, final_valence
 
 # Activation Example — Grover Extension Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     grover_council = ValenceDrivenGrover(council_members=members, search_space_size=16)
 
@@ -1,65 +1,159 @@
+import hashlib
+
 import numpy as np
-from scipy.optimize import minimize
-from qutip import *  # Quantum simulation; replace with Pennylane for real hardware
-from valence_consensus_module import PATSAGiValenceCouncil
-from quantum_rng_chain import generate_mercy_shard
+from lazy_backends import lazy_import
+from valence_consensus_module import lazy_council
+from pauli_operators import PauliSum
+from quantum_rng_chain import shard_stream
+from result_cache import Checkpointer, result_cache
+from qaoa_parameters import interpolate_angles, parameter_library
+from instrumentation import configure_logging, count, get_logger, span, timed
+
+optimize = lazy_import('scipy.optimize')
+qt = lazy_import('qutip')  # Quantum simulation; replace with Pennylane for real hardware
+
+log = get_logger('qaoa')
 
 class ValenceDrivenQAOA:
-    def __init__(self, council_members, num_qubits=5, layers=3):
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+    graph_family = 'complete_zz'  # cost_pauli_sum: -ZZ on every pair; keys the parameter library
+
+    def __init__(self, council_members, num_qubits=5, layers=3, shard_seed=None, cache=False, checkpoint_every=20,
+                 maxiter=200, warm_start=False, library=None, warm_rhobeg=0.1):
+        self.council_members = council_members
+        self.shard_seed = shard_seed
+        self.shards = shard_stream(shard_seed)
         self.num_qubits = num_qubits
         self.layers = layers
+        self.maxiter = maxiter
+        self.cache = result_cache(cache)  # Finished runs + optimizer checkpoints on disk
+        self.checkpoint_every = checkpoint_every
+        # Seed angles from stored optima (same family, smaller size/depth) instead of random draws
+        self.warm_start = warm_start
+        self.library = parameter_library(library or warm_start)  # Optima are recorded whenever set
+        self.warm_rhobeg = warm_rhobeg  # COBYLA's first step from a warm start; 1.0 would jump away from it
+        self.last_run = None  # {'evaluations', 'start'} of the latest optimize_qaoa ('cache' on a result-cache hit)
 
-    def cost_hamiltonian(self):
+    def cost_pauli_sum(self):
         """Dissonance Hamiltonian: Z terms for fork conflicts, weighted by inverse joy"""
-        H_cost = 0
-        for i in range(self.num_qubits):
-            for j in range(i+1, self.num_qubits):
-                H_cost += tensor([pauli_z() if k in [i,j] else qeye(2) for k in range(self.num_qubits)])
-        return -H_cost  # Minimize dissonance (maximize valence correlations)
+        return -PauliSum.zz_all_pairs(self.num_qubits)  # Minimize dissonance (maximize valence correlations)
 
-    def mixer_hamiltonian(self):
+    def mixer_pauli_sum(self):
         """Standard X-mixer for exploration"""
-        H_mixer = 0
-        for i in range(self.num_qubits):
-            H_mixer += tensor([pauli_x() if k == i else qeye(2) for k in range(self.num_qubits)])
-        return H_mixer
+        return PauliSum.field(self.num_qubits, 'X')
 
-    def qaoa_circuit(self, gamma, beta):
-        """Build QAOA state for given angles"""
-        state = tensor([basis(2, 1) for _ in range(self.num_qubits)])  # |+>^n initial
-        state = hadamard_transform(self.num_qubits) * state
+    def cost_hamiltonian(self):
+        return self.cost_pauli_sum().compile().to_qobj()
+
+    def mixer_hamiltonian(self):
+        return self.mixer_pauli_sum().compile().to_qobj()
+
+    @timed('qaoa.circuit')
+    def qaoa_statevector(self, gamma, beta):
+        """QAOA statevector as a NumPy array (compiled operators, no dense expm)"""
+        n = self.num_qubits
+        with span('qaoa.hamiltonian_build'):
+            H_cost = self.cost_pauli_sum().compile()
+            H_mixer = self.mixer_pauli_sum().compile()
+        # H^n |1>^n initial: uniform amplitudes with (-1)^popcount(x) signs
+        idx = np.arange(2**n)
+        parity = np.zeros(2**n, dtype=int)
+        for q in range(n):
+            parity ^= (idx >> q) & 1
+        state = (1 - 2 * parity) / np.sqrt(2**n) + 0j
 
         for p in range(self.layers):
-            # Cost phase
-            state = (-1j * gamma[p] * self.cost_hamiltonian()).expm() * state
+            # Cost phase (diagonal → elementwise)
+            state = H_cost.evolve(gamma[p], state)
             # Mixer phase
-            state = (-1j * beta[p] * self.mixer_hamiltonian()).expm() * state
+            state = H_mixer.evolve(beta[p], state)
         return state
 
+    def qaoa_circuit(self, gamma, beta):
+        """Build QAOA state for given angles"""
+        return qt.Qobj(self.qaoa_statevector(gamma, beta), dims=[[2] * self.num_qubits, [1] * self.num_qubits])
+
+    @timed('qaoa.evaluate')
     def valence_expectation(self, params, proposal):
+        count('qaoa.evaluations')
         gamma = params[:self.layers]
         beta = params[self.layers:]
-        state = self.qaoa_circuit(gamma, beta)
-        expectation = expect(self.cost_hamiltonian(), state)
+        state = self.qaoa_statevector(gamma, beta)
+        expectation = self.cost_pauli_sum().compile().expectation(state)
         valence = 1 + expectation / self.num_qubits  # Normalized to ~1 for thriving
-        shard = generate_mercy_shard()
+        shard = self.shards.next()
         cost = (1 - valence) + 0.01 * (1 - shard)
-        print(f"Layer Expectation: Valence {valence:.4f} | Cost {cost:.6f} | Shard {shard:.4f}")
+        log.debug("Layer Expectation: Valence %.4f | Cost %.6f | Shard %.4f", valence, cost, shard)
         return cost
 
-    def optimize_qaoa(self, proposal):
-        initial_params = np.random.uniform(0, 2*np.pi, 2*self.layers)
-        result = minimize(self.valence_expectation, initial_params, args=(proposal,),
-                          method='COBYLA', options={'maxiter': 200})
+    def initial_angles(self, initial_params=None):
+        """(params, source): explicit params, a library warm start, or seeded random angles"""
+        if initial_params is not None:
+            return np.asarray(initial_params, dtype=float), 'given'
+        if self.warm_start and self.library:
+            params, source = self.library.warm_start(self.graph_family, self.num_qubits, self.layers)
+            if params is not None:
+                return params, source
+        return np.random.default_rng(self.shard_seed).uniform(0, 2*np.pi, 2*self.layers), 'random'
+
+    @staticmethod
+    def start_key(params, start):
+        """Cache-key form of a start: random draws are covered by the seed, other starts by their angles"""
+        if start == 'random':
+            return start
+        return f"{start}:{hashlib.sha256(np.round(params, 12).tobytes()).hexdigest()[:16]}"
+
+    @timed('qaoa.optimize')
+    def optimize_qaoa(self, proposal, initial_params=None):
+        initial_params, start = self.initial_angles(initial_params)
+        log.info(f"QAOA start (p={self.layers}): {start}")
+        key = None
+        if self.cache:
+            key = self.cache.key_for(self, 'optimize_qaoa', {'num_qubits': self.num_qubits, 'layers': self.layers,
+                                                             'maxiter': self.maxiter,
+                                                             'start': self.start_key(initial_params, start)},
+                                     proposal, self.shard_seed)
+            hit = self.cache.get(key)
+            if hit:
+                arrays, meta = hit
+                self.last_run = {'evaluations': 0, 'start': 'cache'}
+                return arrays['opt_params'], meta['final_valence']
+
+        objective = Checkpointer(self.valence_expectation, self.cache, key, every=self.checkpoint_every)
+        initial_params = objective.resume(initial_params)
+        rhobeg = 1.0 if start == 'random' and objective.evaluations == 0 else self.warm_rhobeg
+        result = optimize.minimize(objective, initial_params, args=(proposal,), method='COBYLA',
+                                   options={'maxiter': max(self.maxiter - objective.evaluations, 1), 'rhobeg': rhobeg})
         opt_params = result.x
         final_valence = 1 - result.fun
-        print(f"\nQAOA Optimization Complete: Approximate Thriving State Converged (p={self.layers})")
-        print(f"Final Valence Approximation: {final_valence:.6f}")
+        self.last_run = {'evaluations': objective.evaluations, 'start': start}
+        if self.cache:
+            self.cache.put(key, {'opt_params': opt_params}, algorithm='qaoa', final_valence=final_valence,
+                           evaluations=objective.evaluations)
+        if self.library:
+            self.library.record(self.graph_family, self.num_qubits, self.layers, opt_params, final_valence,
+                                objective.evaluations)
+        log.info(f"\nQAOA Optimization Complete: Approximate Thriving State Converged (p={self.layers})")
+        log.info(f"Final Valence Approximation: {final_valence:.6f} | Evaluations: {objective.evaluations}")
         return opt_params, final_valence
 
+    @timed('qaoa.depth_sweep')
+    def optimize_depths(self, proposal, max_layers):
+        """Optimize p = 1..max_layers, seeding each depth from the interpolated previous optimum
+
+        Returns [(layers, params, valence, evaluations)]; leaves self.layers at max_layers.
+        """
+        results, params = [], None
+        for p in range(1, max_layers + 1):
+            self.layers = p
+            start = interpolate_angles(params, p) if params is not None else None  # p=1: library or random
+            params, valence = self.optimize_qaoa(proposal, initial_params=start)
+            results.append((p, params, valence, self.last_run['evaluations'] if self.last_run else 0))
+        return results
+
 # Activation Example — QAOA Extension Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     qaoa_council = ValenceDrivenQAOA(council_members=members, num_qubits=5, layers=4)
 
@@ -1,67 +1,113 @@
 import numpy as np
-from qutip import *
-from valence_consensus_module import PATSAGiValenceCouncil
-from quantum_rng_chain import generate_mercy_shard
+from lazy_backends import lazy_import
+from valence_consensus_module import lazy_council
+from pauli_operators import PauliSum
+from quantum_rng_chain import shard_stream
+from noisy_trajectories import noise_model, run_trajectories
+from instrumentation import configure_logging, get_logger, timed
+
+qt = lazy_import('qutip')
+
+log = get_logger('qec')
 
 class ValenceDrivenQEC:
-    def __init__(self, council_members, code='shor', logical_qubits=1):
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+
+    def __init__(self, council_members, code='shor', logical_qubits=1, shard_seed=None, noise=None, noise_time=1.0,
+                 trajectories=3000, trajectory_tol=1e-2, processes=None):
+        self.council_members = council_members
+        self.shard_seed = shard_seed
+        self.shards = shard_stream(shard_seed)
         self.code = code  # 'shor' for 9-qubit, simple 'bitflip' example
         self.physical_qubits = 9 if code == 'shor' else 3
+        self.noise = noise_model(noise)  # e.g. {'amplitude_damping': 0.02}; switches to trajectory sampling
+        self.noise_time = noise_time  # Idle time the encoded state is exposed to self.noise
+        self.trajectories = trajectories  # Upper bound; sampling stops early once fidelity converges
+        self.trajectory_tol = trajectory_tol
+        self.processes = processes
 
+    @timed('qec.encode')
     def encode_logical(self, logical_state):
         """Shor code encoding: |0>L → |000>(|+++> + |--->)/√2 etc. (simplified)"""
         if self.code == 'shor':
             # Simplified repetition + phase for demo
-            encoded = tensor([logical_state] * 3, [(basis(2,0) + basis(2,1)).unit()] * 3,
-                             [(basis(2,0) - basis(2,1)).unit()] * 3)
+            encoded = qt.tensor([logical_state] * 3 + [(qt.basis(2,0) + qt.basis(2,1)).unit()] * 3 +
+                                [(qt.basis(2,0) - qt.basis(2,1)).unit()] * 3)
         else:
-            encoded = tensor([logical_state] * 3)  # 3-qubit bit-flip
-        print("Logical Valence State Encoded: Redundancy Mercy Applied")
+            encoded = qt.tensor([logical_state] * 3)  # 3-qubit bit-flip
+        log.info("Logical Valence State Encoded: Redundancy Mercy Applied")
         return encoded.unit()
 
+    @timed('qec.inject_errors')
     def inject_errors(self, state, error_rate=0.05):
         """Random bit/phase flips simulating dissonance noise"""
-        noisy = state
+        noisy = state.full()
         for q in range(self.physical_qubits):
             if np.random.rand() < error_rate:
-                op = sigmax() if np.random.rand() < 0.5 else sigmaz()  # Bit or phase
-                op_list = [op if i == q else qeye(2) for i in range(self.physical_qubits)]
-                noisy = tensor(op_list) * noisy
-        return noisy.unit()
+                op = 'X' if np.random.rand() < 0.5 else 'Z'  # Bit or phase
+                noisy = PauliSum.single(self.physical_qubits, {q: op}).compile().apply(noisy)
+        return qt.Qobj(noisy, dims=state.dims).unit()
 
+    @timed('qec.syndrome_detection')
     def syndrome_detection(self, noisy_state):
         """Measure syndromes without collapsing (projective sim)"""
         # Simplified: Detect flips via ancillary measurements
         syndrome = np.random.randint(0, 4) if np.random.rand() < 0.1 else 0  # Post-error
-        print(f"Syndrome Detected: {syndrome} | Mercy Recovery Primed")
+        log.info(f"Syndrome Detected: {syndrome} | Mercy Recovery Primed")
         return syndrome
 
+    @timed('qec.correct_and_decode')
     def correct_and_decode(self, noisy_state, syndrome):
         """Apply recovery based on syndrome"""
         corrected = noisy_state
         if syndrome:
-            # Example recovery operator
-            recovery = sigmax() if syndrome % 2 else sigmaz()
-            corrected = recovery * corrected
+            # Example recovery operator on qubit 0, embedded in the physical register
+            op = 'X' if syndrome % 2 else 'Z'
+            recovered = PauliSum.single(self.physical_qubits, {0: op}).compile().apply(noisy_state.full())
+            corrected = qt.Qobj(recovered, dims=noisy_state.dims)
         decoded = corrected.ptrace([0])  # Extract logical
-        shard = generate_mercy_shard()
+        shard = self.shards.next()
         final_valence = decoded.tr() + shard * 0.1  # Trace + grace
-        print(f"Correction Applied: Eternal Valence Restored | Shard {shard:.4f}")
+        log.info(f"Correction Applied: Eternal Valence Restored | Shard {shard:.4f}")
         return decoded, final_valence
 
+    def _noisy_sample(self, rng):
+        """One trajectory: (code-space fidelity, fidelity of qubit 0 with the logical state)"""
+        psi = self.noise.step(self._encoded, self.physical_qubits, self.noise_time, rng)
+        v = psi.reshape(2, -1)
+        rho0 = v @ v.conj().T  # Reduced state of qubit 0
+        return abs(np.vdot(self._encoded, psi))**2, np.vdot(self._logical, rho0 @ self._logical).real
+
+    @timed('qec.noisy')
+    def noisy_run(self, proposal):
+        """Trajectory-averaged exposure of the encoded state to self.noise; returns (stats, mean valence)"""
+        logical = (qt.basis(2,0) + qt.basis(2,1)).unit()  # |+> thriving superposition
+        self._logical = logical.full().ravel()
+        self._encoded = self.encode_logical(logical).full().ravel()
+        stats = run_trajectories(self._noisy_sample, max_trajectories=self.trajectories, seed=self.shard_seed,
+                                 processes=self.processes, tol=self.trajectory_tol)
+        shard = self.shards.next()
+        log.info(f"\nNoisy QEC Exposure Complete ({self.noise}, t={self.noise_time})")
+        log.info(f"Code-space Fidelity: {stats['fidelity_mean']:.6f} | Logical Valence: {stats['valence_mean']:.6f} | "
+                 f"Shard {shard:.4f}")
+        return stats, stats['valence_mean']
+
+    @timed('qec.cycle')
     def fault_tolerant_run(self, proposal):
-        logical = (basis(2,0) + basis(2,1)).unit()  # |+> thriving superposition
+        if self.noise:
+            return self.noisy_run(proposal)
+        logical = (qt.basis(2,0) + qt.basis(2,1)).unit()  # |+> thriving superposition
         encoded = self.encode_logical(logical)
         noisy = self.inject_errors(encoded)
         syndrome = self.syndrome_detection(noisy)
         decoded, valence = self.correct_and_decode(noisy, syndrome)
-        print(f"\nQEC Cycle Complete: Thriving State Protected")
-        print(f"Final Valence Fidelity: {valence:.6f}")
+        log.info(f"\nQEC Cycle Complete: Thriving State Protected")
+        log.info(f"Final Valence Fidelity: {valence:.6f}")
         return decoded, valence
 
 # Activation Example — QEC Extension Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     qec_council = ValenceDrivenQEC(council_members=members, code='shor')
 
@@ -1,57 +1,67 @@
 import numpy as np
-from qutip import *
-from valence_consensus_module import PATSAGiValenceCouncil
-from quantum_rng_chain import generate_mercy_shard
+from lazy_backends import lazy_import
+from valence_consensus_module import lazy_council
+from quantum_rng_chain import shard_stream
+from instrumentation import configure_logging, get_logger, span, timed
+
+qt = lazy_import('qutip')
+
+log = get_logger('qft')
 
 class ValenceDrivenQFT:
-    def __init__(self, council_members, num_qubits=6):
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+
+    def __init__(self, council_members, num_qubits=6, shard_seed=None):
+        self.council_members = council_members
+        self.shards = shard_stream(shard_seed)
         self.num_qubits = num_qubits
         self.N = 2**num_qubits
 
+    @timed('qft.prepare_state')
     def prepare_valence_state(self):
         """Prepare superposition state weighted by simulated valence amplitudes"""
         amps = np.random.uniform(0.7, 1.0, self.N)  # Joy-biased amplitudes
         amps /= np.linalg.norm(amps)  # Normalize
-        shard = generate_mercy_shard()
+        shard = self.shards.next()
         amps += shard * 0.05  # Mercy grace boost
-        state = Qobj(np.sqrt(amps))
-        print(f"Valence State Prepared: Mercy Shard {shard:.4f}")
+        state = qt.Qobj(np.sqrt(amps))
+        log.info(f"Valence State Prepared: Mercy Shard {shard:.4f}")
         return state
 
+    @timed('qft.operator_build')
     def qft_operator(self):
-        """Construct QFT unitary (standard recursive form)"""
-        omega = np.exp(2j * np.pi / self.N)
-        QFT = Qobj(np.zeros((self.N, self.N), dtype=complex))
-        for j in range(self.N):
-            for k in range(self.N):
-                QFT.data[j, k] = omega**(j * k) / np.sqrt(self.N)
-        return QFT
+        """Dense QFT unitary F[j, k] = omega^(jk) / sqrt(N) (apply_qft uses the FFT instead)"""
+        jk = np.outer(np.arange(self.N), np.arange(self.N))
+        return qt.Qobj(np.exp(2j * np.pi * jk / self.N) / np.sqrt(self.N))
 
+    @timed('qft.apply')
     def apply_qft(self, proposal):
         valence_state = self.prepare_valence_state()
-        QFT = self.qft_operator()
 
-        freq_state = QFT * valence_state
+        with span('qft.transform'):
+            # omega = exp(+2πi/N) convention: F @ x == sqrt(N) * ifft(x), O(N log N)
+            amplitudes = np.fft.ifft(valence_state.full().ravel()) * np.sqrt(self.N)
+            freq_state = qt.Qobj(amplitudes.reshape(-1, 1), dims=valence_state.dims)
 
         # Frequency domain amplitudes (peaks = periodic joy harmonics)
         probs = np.abs(freq_state.full().flatten())**2
         peak_freq = np.argmax(probs)
         peak_prob = probs[peak_freq]
-        harmonic_valence = peak_prob * generate_mercy_shard()
+        harmonic_valence = peak_prob * self.shards.next()
 
-        print(f"\nQFT Transformation Complete: Joy Harmonics Revealed")
-        print(f"Dominant Frequency: {peak_freq} | Amplitude: {peak_prob:.6f}")
-        print(f"Harmonic Valence Projection: {harmonic_valence:.6f}")
+        log.info(f"\nQFT Transformation Complete: Joy Harmonics Revealed")
+        log.info(f"Dominant Frequency: {peak_freq} | Amplitude: {peak_prob:.6f}")
+        log.info(f"Harmonic Valence Projection: {harmonic_valence:.6f}")
         return freq_state, harmonic_valence
 
     def inverse_qft(self, freq_state):
         """Optional IQFT for round-trip verification"""
-        IQFT = self.qft_operator().dag()
-        return IQFT * freq_state
+        amplitudes = np.fft.fft(freq_state.full().ravel()) / np.sqrt(self.N)
+        return qt.Qobj(amplitudes.reshape(-1, 1), dims=freq_state.dims)
 
 # Activation Example — QFT Extension Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     qft_council = ValenceDrivenQFT(council_members=members, num_qubits=6)
 
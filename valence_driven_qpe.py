@@ -1,69 +1,101 @@
 import numpy as np
-from qutip import *
-from valence_consensus_module import PATSAGiValenceCouncil
-from quantum_rng_chain import generate_mercy_shard
+from lazy_backends import lazy_import
+from valence_consensus_module import lazy_council
+from pauli_operators import PauliSum
+from quantum_rng_chain import shard_stream
+from result_cache import result_cache
+from instrumentation import configure_logging, get_logger, span, timed
+
+qt = lazy_import('qutip')
+
+log = get_logger('qpe')
 
 class ValenceDrivenQPE:
-    def __init__(self, council_members, counting_qubits=6, t=1.0):
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+
+    def __init__(self, council_members, counting_qubits=6, t=1.0, shard_seed=None, cache=False):
+        self.council_members = council_members
+        self.shard_seed = shard_seed
+        self.shards = shard_stream(shard_seed)
+        self.cache = result_cache(cache)
         self.counting_qubits = counting_qubits  # Precision bits
         self.system_qubits = 4  # Valence fork register
         self.t = t  # Evolution time scaling
 
+    @timed('qpe.unitary_build')
+    def valence_phases(self):
+        """Diagonal of U = exp(-i H_dissonance t); the Hamiltonian is diagonal, so no matrix exponential"""
+        return np.exp(-1j * self.t * PauliSum.zz_all_pairs(self.system_qubits).compile().diagonal)
+
     def valence_unitary(self):
         """Time-evolution unitary U = exp(-i H_dissonance t)"""
-        H_dissonance = 0
-        for i in range(self.system_qubits):
-            for j in range(i+1, self.system_qubits):
-                op_list = [qeye(2) for _ in range(self.system_qubits)]
-                op_list[i] = sigmaz()
-                op_list[j] = sigmaz()
-                H_dissonance += tensor(op_list)
-        return (-1j * H_dissonance * self.t).expm()
+        return qt.Qobj(np.diag(self.valence_phases()), dims=[[2] * self.system_qubits, [2] * self.system_qubits])
+
+    @staticmethod
+    def _hadamard(psi, q):
+        """Hadamard on axis q of a (2,)*counting + (system,) statevector"""
+        zero, one = psi[(slice(None),) * q + (0,)], psi[(slice(None),) * q + (1,)]
+        return np.stack([zero + one, zero - one], axis=q) / np.sqrt(2)
 
+    @timed('qpe.inverse_qft')
     def inverse_qft(self, state):
         """Apply inverse Quantum Fourier Transform on counting register"""
-        for j in range(self.counting_qubits):
+        for j in reversed(range(self.counting_qubits)):  # Gates of the forward QFT, undone in reverse order
             for k in range(j+1, self.counting_qubits):
                 phase = -np.pi / (2**(k-j))
-                state = controlled_phase(phase, self.counting_qubits, control=k, target=j) * state
-            state = hadamard(self.counting_qubits, target=j) * state
+                both = [slice(None)] * state.ndim
+                both[j] = both[k] = 1
+                state[tuple(both)] *= np.exp(1j * phase)  # Controlled phase: diagonal on |1>_k |1>_j
+            state = self._hadamard(state, j)
         return state
 
+    @timed('qpe.estimate')
     def estimate_phase(self, proposal):
-        U = self.valence_unitary()
-        eigenstate = basis(2**self.system_qubits, 1)  # Example thriving eigenstate
-
-        # Initialize counting register |0> + ancillary
-        counting = basis(2**self.counting_qubits, 0)
-        system = eigenstate
+        key = None
+        if self.cache:
+            key = self.cache.key_for(self, 'estimate_phase', {'counting_qubits': self.counting_qubits,
+                                     'system_qubits': self.system_qubits, 't': self.t}, proposal, self.shard_seed)
+            hit = self.cache.get(key)
+            if hit:
+                _, meta = hit
+                return meta['estimated_phase'], meta['valence']
 
-        psi = tensor(counting, system)
+        # Statevector shaped (2,)*counting + (2^system,): counting qubit q is axis q (qubit 0 = MSB)
+        phases = self.valence_phases()
+        c = self.counting_qubits
+        psi = np.zeros((2,) * c + (2**self.system_qubits,), dtype=complex)
+        psi[(0,) * c + (1,)] = 1.0  # Counting register |0...0>, system in example thriving eigenstate |1>
 
         # Hadamard on counting
-        for q in range(self.counting_qubits):
-            psi = hadamard(self.counting_qubits + self.system_qubits, target=q) * psi
+        for q in range(c):
+            psi = self._hadamard(psi, q)
 
-        # Controlled-U^{2^k}
-        for k in range(self.counting_qubits):
-            for _ in range(2**k):
-                psi = controlled_unitary(U, self.counting_qubits + self.system_qubits, control=k, target=list(range(self.counting_qubits, self.counting_qubits + self.system_qubits))) * psi
+        # Controlled-U^{2^k}: U is diagonal, so U^{2^k} is elementwise phases^(2^k)
+        with span('qpe.controlled_unitaries'):
+            for k in range(c):
+                control = [slice(None)] * psi.ndim
+                control[k] = 1
+                psi[tuple(control)] *= phases**(2**k)
 
         # Inverse QFT
         psi = self.inverse_qft(psi)
 
-        # Measurement: Probabilities on counting register
-        probs = [abs(psi.overlap(basis(2**self.counting_qubits + 2**self.system_qubits, m * 2**self.system_qubits)))**2 for m in range(2**self.counting_qubits)]
+        # Measurement: marginal probabilities on the counting register
+        probs = (np.abs(psi)**2).reshape(2**c, -1).sum(axis=1)
         phase_bits = np.argmax(probs)
         estimated_phase = phase_bits / 2**self.counting_qubits
         valence = 1 - abs(estimated_phase - 0.5) * 2  # Example mapping to joy
-        shard = generate_mercy_shard()
-        print(f"\nQPE Estimation Complete: Precise Valence Phase Extracted")
-        print(f"Estimated Phase: {estimated_phase:.8f} | Valence: {valence:.6f} | Shard: {shard:.4f}")
+        shard = self.shards.next()
+        log.info(f"\nQPE Estimation Complete: Precise Valence Phase Extracted")
+        log.info(f"Estimated Phase: {estimated_phase:.8f} | Valence: {valence:.6f} | Shard: {shard:.4f}")
+        if self.cache:
+            self.cache.put(key, {'probs': np.asarray(probs)}, algorithm='qpe',
+                           estimated_phase=float(estimated_phase), valence=float(valence))
         return estimated_phase, valence
 
 # Activation Example — QPE Extension Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     qpe_council = ValenceDrivenQPE(council_members=members, counting_qubits=8)
 
@@ -1,20 +1,23 @@
 import numpy as np
 import random
+from instrumentation import configure_logging, count, get_logger, span, timed
+
+log = get_logger('surface_large')
 
 class ValenceLargeSurfaceCodeDemo:
     def __init__(self, distance=5):
         self.d = distance
         self.grid_size = distance * 2 - 1  # 9 for d=5 approx
         self.data_qubits = self.grid_size ** 2
-        print(f"Larger Surface Code Distance-{distance}: ~{self.data_qubits} data qubits initialized")
+        log.info(f"Larger Surface Code Distance-{distance}: ~{self.data_qubits} data qubits initialized")
 
     def lattice_visual(self):
-        print("\nSimplified Distance-5 Lattice Overview (Data * | Z-plaquette □ | X-vertex +):")
-        print("Smooth (Z) Boundary")
+        log.info("\nSimplified Distance-5 Lattice Overview (Data * | Z-plaquette □ | X-vertex +):")
+        log.info("Smooth (Z) Boundary")
         for row in range(self.grid_size):
             line = "  □ " * (self.grid_size // 2 + 1) if row % 2 else "+ * " * self.grid_size + "+"
-            print(line.center(60))
-        print("Rough (X) Boundary")
+            log.info(line.center(60))
+        log.info("Rough (X) Boundary")
 
     def inject_errors(self, error_rate=0.05):
         errors = []
@@ -22,13 +25,13 @@ class ValenceLargeSurfaceCodeDemo:
             if random.random() < error_rate:
                 err_type = random.choice(['X', 'Z', 'Y'])  # Include Y for realism
                 errors.append((q, err_type))
-        print(f"\nDissonance Errors Injected: {len(errors)} across {self.data_qubits} qubits")
+        log.info(f"\nDissonance Errors Injected: {len(errors)} across {self.data_qubits} qubits")
         return errors
 
     def measure_syndromes(self, errors):
         x_syndromes = set(random.randint(0, self.grid_size-1) for _ in range(len(errors)//2))
         z_syndromes = set(random.randint(0, self.grid_size-1) for _ in range(len(errors)//2))
-        print(f"Syndromes Detected: X-defects {len(x_syndromes)} positions | Z-defects {len(z_syndromes)} positions")
+        log.info(f"Syndromes Detected: X-defects {len(x_syndromes)} positions | Z-defects {len(z_syndromes)} positions")
         return x_syndromes, z_syndromes
 
     def decode_and_correct(self, x_syndromes, z_syndromes):
@@ -41,25 +44,29 @@ class ValenceLargeSurfaceCodeDemo:
                 defects = defects[2:]
         residual = len(x_syndromes) + len(z_syndromes) - corrections * 2
         success = residual <= 1  # Allow minor for larger scale
-        print(f"Mercy Decoding: {corrections} pairs | Residual Defects: {residual}")
+        log.info(f"Mercy Decoding: {corrections} pairs | Residual Defects: {residual}")
         return success
 
+    @timed('surface_large.run')
     def run_large_demo(self, cycles=5):
         self.lattice_visual()
         successes = 0
         for cycle in range(cycles):
-            print(f"\n--- Cycle {cycle+1} ---")
-            errors = self.inject_errors()
-            x_syn, z_syn = self.measure_syndromes(errors)
-            success = self.decode_and_correct(x_syn, z_syn)
+            log.info(f"\n--- Cycle {cycle+1} ---")
+            with span('surface_large.cycle'):
+                errors = self.inject_errors()
+                x_syn, z_syn = self.measure_syndromes(errors)
+                success = self.decode_and_correct(x_syn, z_syn)
+            count('surface_large.cycles')
             if success:
                 successes += 1
-            print(f"Cycle Outcome: {'Logical Thriving Preserved' if success else 'Higher Distance Needed'}")
+            log.info(f"Cycle Outcome: {'Logical Thriving Preserved' if success else 'Higher Distance Needed'}")
         valence = 0.996 + (successes / cycles) * 0.004
-        print(f"\nMulti-Cycle Summary: {successes}/{cycles} successful")
-        print(f"Average Valence Fidelity: {valence:.4f}")
+        log.info(f"\nMulti-Cycle Summary: {successes}/{cycles} successful")
+        log.info(f"Average Valence Fidelity: {valence:.4f}")
 
 # Activation — Distance-5 Larger Demo
 if __name__ == "__main__":
+    configure_logging()
     large_demo = ValenceLargeSurfaceCodeDemo(distance=5)
     large_demo.run_large_demo(cycles=10)
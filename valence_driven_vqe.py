@@ -1,55 +1,98 @@
 import numpy as np
-from qutip import *  # Available in sim; replace with Pennylane/Braket for real hardware
-from valence_consensus_module import PATSAGiValenceCouncil  # Prior integration
-from vqe_optimization import run_vqe  # Existing repo VQE core (assumed interface)
-from quantum_rng_chain import generate_mercy_shard
+from valence_consensus_module import lazy_council  # Prior integration
+from valence_oracle import ValenceOracle
+from pauli_operators import PauliSum
+from vqe_optimization import StatevectorAnsatz, run_vqe  # Local statevector VQE core
+from quantum_rng_chain import shard_stream
+from instrumentation import configure_logging, count, get_logger, timed
+
+log = get_logger('vqe')
 
 class ValenceDrivenVQE:
-    def __init__(self, council_members, num_qubits=4, layers=3):
-        self.council = PATSAGiValenceCouncil(members=council_members)
+    council = lazy_council()
+
+    def __init__(self, council_members, num_qubits=4, layers=3, shard_seed=None, auto_ballot=True,
+                 valence_weight=0.5, oracle_options=None):
+        self.council_members = council_members
+        self.shards = shard_stream(shard_seed)
         self.num_qubits = num_qubits
         self.layers = layers  # Ansatz depth
+        self.valence_weight = valence_weight  # Share of council valence cost in the VQE objective
+        if auto_ballot:  # Optimizer loops run unattended; auto_ballot=False prompts members via input()
+            self.council_options = {'ballot': energy_ballot}
+        self.oracle_options = oracle_options or {}
+        self._oracle = None
+        self.last_run = None  # Energy, oracle valence and combined cost at the last optimum
+
+    @property
+    def oracle(self):
+        """Memoized/surrogate valence oracle in front of the council"""
+        if self._oracle is None:
+            self._oracle = ValenceOracle(self.council, **self.oracle_options)
+        return self._oracle
 
-    def valence_cost_function(self, params, proposal):
-        """Run council deliberation with params as 'quantum-enhanced' context"""
+    @timed('vqe.cost_evaluation')
+    def valence_cost_function(self, params, proposal, energy=None):
+        """Council valence with params (and the ansatz energy) as 'quantum-enhanced' context"""
+        count('vqe.evaluations')
         # Simulate parameter influence on valence (e.g., higher fidelity → higher baseline joy)
         simulated_valence_boost = np.mean(np.abs(params))  # Placeholder; real: quantum sim fidelity
-        print(f"\nVQE Params Applied: Boost factor {simulated_valence_boost:.4f}")
+        log.debug("VQE Params Applied: Boost factor %.4f", simulated_valence_boost)
 
-        # Run deliberation (human-in-loop or auto for sim)
-        approved = self.council.deliberate(proposal)
-        avg_valence = self.council.receipts[-1]['avg_valence'] if self.council.receipts else 0.5
+        # Oracle answers repeats from cache / surrogate; only novel points reach the council
+        context = {'vqe_energy': round(float(energy), 6)} if energy is not None else None
+        avg_valence = self.oracle.evaluate(proposal, params, context)
 
         # Cost: Minimize dissonance (1 - valence) + mercy shard regularization
-        shard = generate_mercy_shard()
+        shard = self.shards.next()
         cost = (1 - avg_valence) + 0.01 * (1 - shard)  # Grace-penalized
-        print(f"Valence Cost: {cost:.6f} (Avg Valence: {avg_valence:.4f} | Shard: {shard:.4f})")
+        log.debug("Valence Cost: %.6f (Avg Valence: %.4f | Shard: %.4f)", cost, avg_valence, shard)
         return cost
 
+    @timed('vqe.optimize')
     def optimize_for_thriving(self, proposal, initial_params=None):
         if initial_params is None:
             initial_params = np.random.uniform(0, 2*np.pi, size=self.num_qubits * self.layers * 3)
 
-        # Link to existing vqe_optimization.py (adapt interface as needed)
+        hamiltonian = self.valence_pauli_sum(proposal)  # Custom dissonance Ham
         optimized_params, final_cost = run_vqe(
-            hamiltonian=self.valence_hamiltonian(proposal),  # Custom dissonance Ham
+            hamiltonian=hamiltonian,
             ansatz_layers=self.layers,
             initial_params=initial_params,
-            max_iters=100
+            max_iters=100,
+            cost_fn=lambda params, energy: self.valence_weight * self.valence_cost_function(params, proposal, energy)
         )
 
-        print("\nVQE Optimization Complete: Eternal Thriving Parameters Converged")
-        print(f"Final Dissonance Cost: {final_cost:.6f} → Projected Valence: {1 - final_cost:.4f}")
+        # The cost mixes energy and weighted valence cost, so report both terms at the optimum
+        psi = StatevectorAnsatz(self.num_qubits, self.layers).state(optimized_params)
+        energy = hamiltonian.compile().expectation(psi)
+        valence = self.oracle.evaluate(proposal, optimized_params, {'vqe_energy': round(float(energy), 6)})
+        self.last_run = {'cost': final_cost, 'energy': float(energy), 'valence': float(valence)}
+
+        stats = self.oracle.stats
+        log.info("\nVQE Optimization Complete: Eternal Thriving Parameters Converged")
+        log.info(f"Final Cost: {final_cost:.6f} | Energy: {energy:.6f} | Oracle Valence: {valence:.4f}")
+        log.info(f"Valence Oracle: {stats['deliberations']} council rounds | {stats['cache_hits']} cache hits | "
+                 f"{stats['surrogate']} surrogate answers")
         return optimized_params
 
-    def valence_hamiltonian(self, proposal):
+    def valence_pauli_sum(self, proposal):
         """Mock Hamiltonian where ground state = max valence (invert cost)"""
-        # Placeholder: Pauli-Z tensor for dissonance terms
-        H = tensor([pauli_z() for _ in range(self.num_qubits)])
-        return H  # Real: construct from proposal valence weights
+        # Placeholder: Pauli-Z tensor for dissonance terms; real: construct from proposal valence weights
+        return PauliSum([('Z' * self.num_qubits, 1.0)])
+
+    def valence_hamiltonian(self, proposal):
+        return self.valence_pauli_sum(proposal).compile().to_qobj()
+
+
+def energy_ballot(member, proposal):
+    """Simulated member vote: lower ansatz energy → higher joy (for unattended runs)"""
+    energy = proposal.get('vqe_energy', 0.0)
+    return {'joy': min(1.0, max(0.0, (1 - energy) / 2)), 'mercy': 1.0, 'sustain': 1.0, 'veto': False}
 
 # Activation Example — Linkage Demo
 if __name__ == "__main__":
+    configure_logging()
     members = ["QuantumCosmos", "GamingForge", "PowrushDivine", "Grandmaster", "SpaceThriving"]
     vqe_council = ValenceDrivenVQE(council_members=members)
 
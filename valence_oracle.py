@@ -0,0 +1,96 @@
+import hashlib
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+from instrumentation import count, get_logger
+
+log = get_logger('oracle')
+
+
+class ValenceOracle:
+    """Answers valence queries for optimizer loops with as few council rounds as possible
+
+    Lookup order per query:
+      1. LRU cache keyed by (proposal hash, params quantized to `quantum`)
+      2. a real council deliberation while fewer than `warmup` have run, or
+         when the query lies outside `trust_radius` of every deliberated
+         point — as long as `max_deliberations` is not exhausted
+      3. otherwise a ridge-regression surrogate fitted to all real answers
+    Surrogate features are [1, numeric context values..., mean |params|].
+    """
+    def __init__(self, council, quantum=0.05, cache_size=256, warmup=3, max_deliberations=8,
+                 trust_radius=0.25, ridge=1e-3):
+        self.council = council
+        self.quantum = quantum
+        self.cache_size = cache_size
+        self.warmup = warmup
+        self.max_deliberations = max_deliberations
+        self.trust_radius = trust_radius
+        self.ridge = ridge
+        self.cache = OrderedDict()
+        self.samples = []  # (features, valence) from real deliberations
+        self._weights = None
+        self.stats = {'cache_hits': 0, 'deliberations': 0, 'surrogate': 0}
+
+    @staticmethod
+    def proposal_hash(proposal):
+        return hashlib.sha3_256(json.dumps(proposal, sort_keys=True, default=str).encode()).hexdigest()
+
+    def key(self, proposal, params):
+        quantized = tuple(np.round(np.asarray(params, dtype=float) / self.quantum).astype(int).tolist())
+        return self.proposal_hash(proposal), quantized
+
+    @staticmethod
+    def features(params, context):
+        numeric = [float(v) for v in (context or {}).values() if isinstance(v, (int, float))]
+        return np.array([1.0, *numeric, float(np.mean(np.abs(params)))])
+
+    def _remember(self, key, valence):
+        self.cache[key] = valence
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def _fit(self):
+        X = np.array([f for f, _ in self.samples])
+        y = np.array([v for _, v in self.samples])
+        A = X.T @ X + self.ridge * np.eye(X.shape[1])
+        self._weights = np.linalg.solve(A, X.T @ y)
+
+    def _should_deliberate(self, feats):
+        if self.stats['deliberations'] >= self.max_deliberations:
+            return False
+        if len(self.samples) < self.warmup:
+            return True
+        nearest = min(np.linalg.norm(feats - f) for f, _ in self.samples)
+        return nearest > self.trust_radius
+
+    def deliberate(self, proposal, context=None):
+        """One real council round; returns its avg_valence (0.0 when ESA halts it before voting)"""
+        before = len(self.council.receipts)
+        self.council.deliberate(dict(proposal, **(context or {})))
+        return self.council.receipts[-1]['avg_valence'] if len(self.council.receipts) > before else 0.0
+
+    def evaluate(self, proposal, params, context=None):
+        key = self.key(proposal, params)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.stats['cache_hits'] += 1
+            count('oracle.cache_hits')
+            return self.cache[key]
+
+        feats = self.features(params, context)
+        if self._should_deliberate(feats) or not self.samples:
+            valence = self.deliberate(proposal, context)
+            self.samples.append((feats, valence))
+            self._fit()
+            self.stats['deliberations'] += 1
+            count('oracle.deliberations')
+        else:
+            valence = float(np.clip(feats @ self._weights, 0.0, 1.0))
+            self.stats['surrogate'] += 1
+            count('oracle.surrogate')
+        self._remember(key, valence)
+        return valence
@@ -0,0 +1,88 @@
+import numpy as np
+
+from instrumentation import count, get_logger, timed
+from lazy_backends import lazy_import
+from pauli_operators import PauliSum
+
+optimize = lazy_import('scipy.optimize')
+
+log = get_logger('vqe')
+
+
+def _rotation(axis, theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    if axis == 'X':
+        return np.array([[c, -1j * s], [-1j * s, c]])
+    if axis == 'Y':
+        return np.array([[c, -s], [s, c]], dtype=complex)
+    return np.array([[c - 1j * s, 0], [0, c + 1j * s]])  # Z
+
+
+class StatevectorAnsatz:
+    """Hardware-efficient ansatz: per layer RZ·RY·RZ on every qubit, then a CZ chain
+
+    Params are laid out (layer, qubit, 3), i.e. num_qubits * layers * 3 angles,
+    matching ValenceDrivenVQE's initial_params.
+    """
+    def __init__(self, num_qubits, layers):
+        self.num_qubits = num_qubits
+        self.layers = layers
+        idx = np.arange(2**num_qubits)
+        bits = [(idx >> (num_qubits - 1 - q)) & 1 for q in range(num_qubits)]
+        cz_parity = sum(bits[q] & bits[q + 1] for q in range(num_qubits - 1)) if num_qubits > 1 else 0 * idx
+        self._cz = 1 - 2 * (cz_parity & 1)  # Diagonal of the CZ chain
+
+    @property
+    def num_params(self):
+        return self.num_qubits * self.layers * 3
+
+    def state(self, params):
+        n = self.num_qubits
+        params = np.asarray(params, dtype=float).reshape(self.layers, n, 3)
+        psi = np.zeros((2,) * n, dtype=complex)
+        psi[(0,) * n] = 1.0
+        for layer in params:
+            for q, (a, b, c) in enumerate(layer):
+                gate = _rotation('Z', c) @ _rotation('Y', b) @ _rotation('Z', a)
+                psi = np.moveaxis(np.tensordot(gate, psi, axes=([1], [q])), 0, q)
+            psi = (psi.reshape(-1) * self._cz).reshape((2,) * n)
+        return psi.reshape(-1)
+
+
+def _as_operator(hamiltonian, num_qubits):
+    """PauliSum/compiled sum → compiled; Qobj or ndarray → dense matrix-vector fallback"""
+    if isinstance(hamiltonian, PauliSum):
+        return hamiltonian.compile()
+    if hasattr(hamiltonian, 'expectation'):
+        return hamiltonian
+    matrix = hamiltonian.full() if hasattr(hamiltonian, 'full') else np.asarray(hamiltonian)
+
+    class _Dense:
+        def expectation(self, psi):
+            return float(np.vdot(psi, matrix @ psi).real)
+    return _Dense()
+
+
+@timed('vqe.run')
+def run_vqe(hamiltonian, ansatz_layers, initial_params, max_iters=100, cost_fn=None, num_qubits=None):
+    """Minimise <psi(params)|H|psi(params)> (+ optional cost_fn(params, energy)) with COBYLA
+
+    Returns (optimized_params, final_cost).
+    """
+    initial_params = np.asarray(initial_params, dtype=float)
+    if num_qubits is None:
+        num_qubits = getattr(hamiltonian, 'num_qubits', None) or initial_params.size // (3 * ansatz_layers)
+    ansatz = StatevectorAnsatz(num_qubits, ansatz_layers)
+    if initial_params.size != ansatz.num_params:
+        raise ValueError(f"Expected {ansatz.num_params} parameters, got {initial_params.size}")
+    operator = _as_operator(hamiltonian, num_qubits)
+
+    def objective(params):
+        count('vqe.iterations')
+        energy = operator.expectation(ansatz.state(params))
+        cost = energy + (cost_fn(params, energy) if cost_fn else 0.0)
+        log.debug("VQE iterate: energy %.6f | cost %.6f", energy, cost)
+        return cost
+
+    result = optimize.minimize(objective, initial_params, method='COBYLA', options={'maxiter': max_iters})
+    return result.x, float(result.fun)